@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Tuple
 
@@ -17,7 +17,15 @@ from src.sources.dxy import DXYCollector
 from src.sources.krx_breadth import KRXBreadthCollector, determine_target
 from src.sources.kr_rates import KRXKorRates
 from src.sources.us_yields import USTYieldCollector
-from src.storage import append_log, cleanup_daily, write_daily, write_latest, write_raw
+from src.storage import (
+    append_log,
+    cleanup_daily,
+    load_run_snapshot,
+    write_daily,
+    write_latest,
+    write_raw,
+    write_run_snapshot,
+)
 from src.universe import load_universe
 from src.utils import KST, load_yaml
 
@@ -73,6 +81,16 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--phase", required=True)
     parser.add_argument("--tz", default="Asia/Seoul")
     parser.add_argument("--reconcile", action="store_true")
+    parser.add_argument(
+        "--reuse-within",
+        type=int,
+        default=0,
+        help=(
+            "같은 phase가 N분 안에 성공했다면 수집을 건너뛰고 그 결과를 다시 씁니다 (0=끔). "
+            "스냅샷은 gitignore된 cache/에 저장되므로 CI처럼 매번 새로 체크아웃하는 환경에서는 "
+            "효과가 없고 로컬 재실행에만 도움이 됩니다."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -94,24 +112,17 @@ def collect_raw(config: Dict, phase: str) -> Tuple[Dict[str, pd.DataFrame], Dict
     ust_collector = USTYieldCollector()
     dxy_collector = DXYCollector()
 
-    for asset in ["KOSPI", "KOSDAQ", "K200", "SPX", "NDX", "SOX"]:
-        frame = market.index_series(client, asset)
-        raw_frames[asset] = frame
-        _store_raw(asset, phase, frame)
-
-    fx_frame = market.fx_series(client, "USDKRW")
-    raw_frames["USD/KRW"] = fx_frame
-    _store_raw("USD_KRW", phase, fx_frame)
-
     futures_map = {
         "ES": config.get("futures", {}).get("es", "ES"),
         "NQ": config.get("futures", {}).get("nq", "NQ"),
     }
-    for alias, symbol in futures_map.items():
-        unit = "pt"
-        frame = market.futures_series(client, symbol, alias=alias, unit=unit)
-        raw_frames[alias] = frame
-        _store_raw(alias, phase, frame)
+    # 지수·환율·선물 시계열은 서로 독립적인 HTTP 조회이므로 한 번에 동시에 요청합니다.
+    series_specs = [("indexes", asset, None, asset, "pt") for asset in ["KOSPI", "KOSDAQ", "K200", "SPX", "NDX", "SOX"]]
+    series_specs.append(("fx", "USDKRW", None, "USD/KRW", "krw"))
+    series_specs += [("futures", symbol, alias, alias, "pt") for alias, symbol in futures_map.items()]
+    for asset, frame in market.series_batch(client, series_specs).items():
+        raw_frames[asset] = frame
+        _store_raw(asset.replace("/", "_"), phase, frame)
 
     breadth_result = breadth_collector.collect(run_ts)
     for asset, frame in breadth_result.frames.items():
@@ -145,7 +156,7 @@ def collect_raw(config: Dict, phase: str) -> Tuple[Dict[str, pd.DataFrame], Dict
     if getattr(client, "symbol_not_found", set()):
         metrics["symbol_not_found"] = sorted(client.symbol_not_found)
 
-    commodities = commod_crypto.fetch()
+    commodities = commod_crypto.fetch(max_workers=client.max_workers)
     for asset, result in commodities.items():
         frame = result.frame
         raw_frames[asset] = frame
@@ -209,7 +220,21 @@ def main() -> int:
     ts = datetime.now(KST)
     append_log(ts, "start", {"phase": args.phase})
 
+    # 같은 phase라도 --reconcile 여부에 따라 최종 레코드가 다르므로 스냅샷을 나눠 둡니다.
+    snapshot_variant = "reconcile" if args.reconcile else ""
+
     try:
+        if args.reuse_within > 0:
+            # 재시도 루프 등으로 같은 phase가 곧바로 다시 돌면 네트워크 수집을 생략합니다.
+            cached = load_run_snapshot(args.phase, ts, timedelta(minutes=args.reuse_within), snapshot_variant)
+            if cached is not None:
+                write_latest(cached)
+                write_daily(cached, ts)
+                cleanup_daily()
+                append_log(ts, "reuse", {"phase": args.phase, "records": len(cached)})
+                append_log(ts, "success", {"phase": args.phase})
+                return 0
+
         raw_frames, notes, metrics = collect_raw(config, args.phase)
         append_log(ts, "raw", {"assets": list(raw_frames)})
         if metrics.get("symbol_not_found"):
@@ -239,6 +264,7 @@ def main() -> int:
                 reconciled = reconciled_df.to_dict("records")
             write_latest(reconciled)
             write_daily(reconciled, ts)
+            records = reconciled
 
         # 17:00 배치에서는 latest.csv를 기반으로 history.csv를 업서트하고 결과를 JSON으로 출력합니다.
         if args.phase in {"1700", "EOD"}:
@@ -287,6 +313,11 @@ def main() -> int:
                     ),
                 )
 
+        # 스냅샷은 재실행용 선택적 캐시이므로 저장에 실패해도 이미 만든 산출물의 성공 여부는 바꾸지 않습니다.
+        try:
+            write_run_snapshot(args.phase, ts, records, snapshot_variant)
+        except (OSError, TypeError, ValueError) as exc:
+            append_log(ts, "warning", {"reason": "run_snapshot", "error": str(exc)})
         append_log(ts, "success", {"phase": args.phase})
         return 0
     except Exception as exc:  # pragma: no cover
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Callable
+from dataclasses import dataclass, field as dataclass_field
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Callable, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,11 +11,12 @@ from datetime import datetime
 import logging
 
 from .utils import (
+    ALLOWED_QUALITIES,
     SCHEMA_COLUMNS,
     clip_numeric,
+    clip_numeric_array,
     coverage_ratio,
-    ensure_schema,
-    rolling_corr,
+    ensure_schema_batch,
     rolling_vol,
     ts_string,
 )
@@ -40,6 +41,11 @@ def _debug_value(name: str, value: float, validator: Callable[[float], bool]) ->
         logger.debug("compute::_debug_value :: validator failure for %s (%s)", name, exc)
 
 
+def _abs_lt_1000(value: float) -> bool:
+    # 스프레드(bp)가 ±1000을 넘으면 단위 혼동을 의심한다.
+    return abs(value) < 1000
+
+
 REQUIRED_KEYS = [
     "KOSPI:idx",
     "KOSDAQ:idx",
@@ -73,34 +79,65 @@ REQUIRED_KEYS = [
     "BTC:spot",
     "BTC:corr20",
 ]
+_REQUIRED_KEY_SET = frozenset(REQUIRED_KEYS)
+
+
+_EMPTY_TS = np.empty(0, dtype="datetime64[ns]")
+_EMPTY_VALUES = np.empty(0, dtype=np.float64)
 
 
-@dataclass
+class BundleStats(NamedTuple):
+    """번들의 최신값, 직전 대비 변화량, 변화율."""
+
+    latest: float
+    change: float
+    pct: float
+
+
+@dataclass(slots=True, frozen=True)
 class SeriesBundle:
+    """(asset, field) 한 쌍의 시계열.
+
+    ``ts``는 시간순으로 정렬된 ``datetime64[ns]``(UTC 기준) 배열이고 ``values``는 같은
+    길이의 ``float64`` 배열이다. pandas는 raw 프레임을 읽을 때만 쓴다.
+    """
+
     asset: str
     field: str
-    series: pd.Series
+    ts: np.ndarray
+    values: np.ndarray
     source: str
     quality: str
     url: str
+    stats: BundleStats = dataclass_field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # 레코드 생성 중 여러 번 참조되므로 번들을 만들 때 한 번만 계산해 둔다.
+        # frozen 데이터클래스라 초기화 시점에만 object.__setattr__로 채운다.
+        object.__setattr__(self, "stats", _stats(self.values))
 
 
 def compute_hv(prices: Sequence[float], window: int) -> float:
     if window <= 0:
         raise ValueError("window must be positive")
-    if len(prices) < 2:
-        return float("nan")
-    log_returns: List[float] = []
-    for prev, curr in zip(prices, prices[1:]):
-        if prev == 0:
-            continue
-        log_returns.append(math.log(curr / prev))
-    if len(log_returns) < window:
+    arr = np.asarray(prices, dtype=np.float64)
+    if arr.size < 2:
         return float("nan")
-    tail = log_returns[-window:]
-    mean = sum(tail) / window
-    variance = sum((val - mean) ** 2 for val in tail) / window
-    return math.sqrt(252 * variance)
+    tail = arr[-(window + 1):]
+    if tail.size == window + 1 and tail[:-1].all():
+        # 흔한 경우: 마지막 window+1개 가격에 0이 없으면 그 구간의 수익률만 계산한다.
+        log_returns = np.log1p(np.diff(tail) / tail[:-1])
+    else:
+        prev = arr[:-1]
+        valid = prev != 0
+        # 직전 가격이 0인 구간은 수익률을 정의할 수 없으므로 건너뛴다.
+        log_returns = np.log1p(np.diff(arr)[valid] / prev[valid])
+        if log_returns.size < window:
+            return float("nan")
+        log_returns = log_returns[-window:]
+    centered = log_returns - log_returns.mean()
+    # 모분산(분모 window)을 내적 한 번으로 구한다.
+    return math.sqrt(252 * float(centered @ centered) / window)
 
 
 def compute_correlation(series_a: Sequence[float], series_b: Sequence[float], window: int) -> float:
@@ -108,16 +145,16 @@ def compute_correlation(series_a: Sequence[float], series_b: Sequence[float], wi
         raise ValueError("window must be greater than 1")
     if len(series_a) < window or len(series_b) < window:
         return float("nan")
-    tail_a = list(series_a)[-window:]
-    tail_b = list(series_b)[-window:]
-    mean_a = sum(tail_a) / window
-    mean_b = sum(tail_b) / window
-    cov = sum((a - mean_a) * (b - mean_b) for a, b in zip(tail_a, tail_b))
-    var_a = sum((a - mean_a) ** 2 for a in tail_a)
-    var_b = sum((b - mean_b) ** 2 for b in tail_b)
+    tail_a = np.asarray(series_a, dtype=np.float64)[-window:]
+    tail_b = np.asarray(series_b, dtype=np.float64)[-window:]
+    # 평균을 뺀 버퍼를 한 번 만들어 공분산·분산 세 개의 내적에 같이 쓴다.
+    centered_a = tail_a - tail_a.mean()
+    centered_b = tail_b - tail_b.mean()
+    var_a = float(np.dot(centered_a, centered_a))
+    var_b = float(np.dot(centered_b, centered_b))
     if var_a == 0 or var_b == 0:
         return float("nan")
-    return cov / math.sqrt(var_a * var_b)
+    return float(np.dot(centered_a, centered_b)) / math.sqrt(var_a * var_b)
 
 
 def compute_basis(future: float, spot: float) -> float:
@@ -126,6 +163,33 @@ def compute_basis(future: float, spot: float) -> float:
     return (future / spot) - 1
 
 
+@dataclass(slots=True)
+class Record:
+    """스키마 한 행. 필드 순서는 ``SCHEMA_COLUMNS``와 같다."""
+
+    ts_kst: str
+    asset: str
+    key: str
+    value: Optional[float]
+    unit: str = ""
+    window: str = ""
+    change_abs: Optional[float] = None
+    change_pct: Optional[float] = None
+    source: str = ""
+    quality: str = "primary"
+    url: str = ""
+    notes: str = ""
+
+    def __getitem__(self, column: str) -> object:
+        try:
+            return getattr(self, column)
+        except AttributeError:
+            raise KeyError(column) from None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {column: getattr(self, column) for column in SCHEMA_COLUMNS}
+
+
 class RecordBuilder:
     def __init__(self, ts: str | datetime) -> None:
         if isinstance(ts, datetime):
@@ -147,68 +211,162 @@ class RecordBuilder:
         quality: str = "primary",
         url: str = "",
         notes: str = "",
-    ) -> Dict[str, object]:
-        record: Dict[str, object] = {
-            "ts_kst": self._ts_kst,
-            "asset": asset,
-            "key": key,
-            "value": clip_numeric(value),
-            "unit": unit,
-            "window": window,
-            "change_abs": clip_numeric(change_abs) if change_abs is not None else None,
-            "change_pct": clip_numeric(change_pct) if change_pct is not None else None,
-            "source": source,
-            "quality": quality,
-            "url": url,
-            "notes": notes,
-        }
-        # ensure optional fields are serialisable
-        for column in SCHEMA_COLUMNS:
-            record.setdefault(column, None)
-        ensure_schema(record)
-        return record
-
-
-def _series_from_raw(raw: Dict[str, pd.DataFrame], asset: str, field: str) -> SeriesBundle:
-    frame = raw.get(asset)
-    if frame is None or frame.empty:
-        return SeriesBundle(asset, field, pd.Series(dtype=float), "", "", "")
-    required = {"field", "ts_kst", "value"}
-    if not required.issubset(frame.columns):
-        return SeriesBundle(asset, field, pd.Series(dtype=float), "", "", "")
-
-    subset = frame[frame["field"] == field].copy()
-    if subset.empty:
-        return SeriesBundle(asset, field, pd.Series(dtype=float), "", "", "")
-    subset["ts_kst"] = pd.to_datetime(subset["ts_kst"])
-    subset.sort_values("ts_kst", inplace=True)
-    subset["value"] = pd.to_numeric(subset["value"], errors="coerce")
-    series = subset.set_index("ts_kst")["value"].dropna()
-    source = str(subset["source"].iloc[-1]) if "source" in subset else ""
-    quality = str(subset["quality"].iloc[-1]) if "quality" in subset else "primary"
-    url = str(subset["url"].iloc[-1]) if "url" in subset else ""
-    return SeriesBundle(asset, field, series, source, quality, url)
-
-
-def _latest(series: pd.Series) -> float:
-    return float(series.iloc[-1]) if not series.empty else float("nan")
-
-
-def _prev(series: pd.Series) -> float:
-    if len(series) < 2:
+    ) -> Record:
+        # 필드가 고정된 Record라 누락 컬럼은 생길 수 없고, quality만 확인하면 된다.
+        # compute_records 결과는 끝에서 utils.ensure_schema_batch로 한 번에 검사하고, 여기서는 디버그 실행에서만 본다.
+        if __debug__ and str(quality).lower() not in ALLOWED_QUALITIES:
+            raise ValueError(f"invalid quality: {quality}")
+        return Record(
+            self._ts_kst,
+            asset,
+            key,
+            clip_numeric(value),
+            unit,
+            window,
+            clip_numeric(change_abs),
+            clip_numeric(change_pct),
+            source,
+            quality,
+            url,
+            notes,
+        )
+
+
+def _empty_bundle(asset: str, field: str) -> SeriesBundle:
+    return SeriesBundle(asset, field, _EMPTY_TS, _EMPTY_VALUES, "", "", "")
+
+
+def _to_datetime64(column: pd.Series) -> np.ndarray:
+    """ts_kst 컬럼을 정렬 가능한 ``datetime64[ns]`` 배열로 바꾼다.
+
+    tz-aware 값은 UTC 기준 시각으로 맞춰 서로 다른 소스끼리도 비교할 수 있게 한다.
+    """
+
+    parsed = pd.to_datetime(column, errors="coerce")
+    if parsed.dtype == object:
+        # 오프셋이 섞인 문자열은 UTC로 통일해야 datetime64로 떨어진다.
+        parsed = pd.to_datetime(column, errors="coerce", utc=True)
+    if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+        parsed = parsed.dt.tz_convert(None)
+    return parsed.to_numpy(dtype="datetime64[ns]")
+
+
+def _frame_datetime64(column: pd.Series) -> Optional[np.ndarray]:
+    """필드가 섞인 프레임의 ts_kst 전체를 한 번에 해석해 본다.
+
+    필드마다 따로 해석할 때와 결과가 같다고 장담할 수 없는 경우(tz 표기가 섞였거나
+    추론된 형식에 맞지 않아 새로 NaT가 생긴 경우)에는 None을 돌려 필드 단위로 되돌린다.
+    """
+
+    try:
+        parsed = pd.to_datetime(column, errors="coerce", cache=True)
+    except (TypeError, ValueError):
+        return None
+    if parsed.dtype == object or parsed.isna().sum() != column.isna().sum():
+        return None
+    if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+        parsed = parsed.dt.tz_convert(None)
+    return parsed.to_numpy(dtype="datetime64[ns]")
+
+
+_RAW_REQUIRED = frozenset({"field", "ts_kst", "value"})
+_RAW_META = (("source", ""), ("quality", "primary"), ("url", ""))
+
+
+def _index_raw(raw: Dict[str, pd.DataFrame]) -> Dict[Tuple[str, str], SeriesBundle]:
+    """raw 프레임을 자산마다 한 번만 훑어 (asset, field)별 번들을 만든다.
+
+    KOSPI처럼 한 프레임에 필드가 여러 개 섞인 경우에도 필드마다 불리언 마스크와
+    복사본을 다시 만들지 않고, 값·메타데이터 컬럼도 프레임 단위로 한 번만 꺼낸다.
+    """
+
+    bundles: Dict[Tuple[str, str], SeriesBundle] = {}
+    for asset, frame in raw.items():
+        if frame is None or frame.empty or not _RAW_REQUIRED.issubset(frame.columns):
+            continue
+        codes, fields = pd.factorize(frame["field"])
+        ts_column = frame["ts_kst"]
+        values_all = pd.to_numeric(frame["value"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        meta_all = [
+            (frame[column].to_numpy(), default) if column in frame else (None, default)
+            for column, default in _RAW_META
+        ]
+        single = len(fields) == 1 and codes.min() == 0
+        # 타임스탬프는 프레임마다 한 번만 해석하고, 필드별로는 위치 인덱스로 잘라 쓴다.
+        ts_all = _to_datetime64(ts_column) if single else _frame_datetime64(ts_column)
+        # 정렬도 프레임 전체에서 한 번만 하고, 필드별로는 정렬된 위치를 걸러 쓴다.
+        # 안정 정렬이므로 필드마다 따로 정렬한 결과와 순서가 같다.
+        frame_order = np.argsort(ts_all, kind="stable") if ts_all is not None else None
+        for code, field in enumerate(fields):
+            if frame_order is not None:
+                positions = frame_order if single else frame_order[codes[frame_order] == code]
+                ts = ts_all[positions]
+            else:
+                positions = np.flatnonzero(codes == code)
+                ts = _to_datetime64(ts_column.iloc[positions])
+                order = np.argsort(ts, kind="stable")
+                positions = positions[order]
+                ts = ts[order]
+            values = values_all[positions]
+            keep = ~(np.isnat(ts) | np.isnan(values))
+            if not keep.all():
+                ts = ts[keep]
+                values = values[keep]
+            last = positions[-1]
+            source, quality, url = (
+                str(column[last]) if column is not None else default for column, default in meta_all
+            )
+            bundles[(asset, field)] = SeriesBundle(asset, field, ts, values, source, quality, url)
+    return bundles
+
+
+def _series_from_raw(bundles: Dict[Tuple[str, str], SeriesBundle], asset: str, field: str) -> SeriesBundle:
+    bundle = bundles.get((asset, field))
+    return bundle if bundle is not None else _empty_bundle(asset, field)
+
+
+def _stats(values: np.ndarray) -> BundleStats:
+    """최신값, 직전 대비 변화량, 변화율을 한 번에 계산한다."""
+
+    if not values.size:
+        return BundleStats(float("nan"), float("nan"), float("nan"))
+    latest = float(values[-1])
+    if values.size < 2:
+        return BundleStats(latest, float("nan"), float("nan"))
+    prev = float(values[-2])
+    change = latest - prev
+    pct = change / prev if prev != 0 else float("nan")
+    return BundleStats(latest, change, pct)
+
+
+def _returns(values: np.ndarray, window: int) -> float:
+    if values.size <= window:
         return float("nan")
-    return float(series.iloc[-2])
+    return float(values[-1] / values[-window - 1] - 1)
+
+
+def _basis(future: SeriesBundle, spot: SeriesBundle) -> float:
+    # 빈 번들의 latest는 NaN이므로 따로 길이를 확인하지 않아도 결과가 NaN이 된다.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.float64(future.stats.latest) / spot.stats.latest - 1)
 
 
-def _change(series: pd.Series) -> float:
-    return _latest(series) - _prev(series)
+def _log_return_corr(left: SeriesBundle, right: SeriesBundle, window: int) -> float:
+    """두 시계열을 같은 시각끼리 맞춘 뒤 로그수익률 상관계수를 구한다.
 
+    수익률을 먼저 구하고 나중에 맞추면 주말처럼 한쪽에만 있는 날짜 때문에 서로 다른
+    구간의 수익률이 짝지어지므로, 가격 단계에서 교집합을 잡은 뒤 차분한다.
+    """
 
-def _pct_change(series: pd.Series) -> float:
-    prev = _prev(series)
-    if np.isnan(prev) or prev == 0:
+    _, idx_left, idx_right = np.intersect1d(left.ts, right.ts, return_indices=True)
+    if idx_left.size <= window:
         return float("nan")
-    return _change(series) / prev
+    # (N, 2) 블록으로 묶어 두 자산의 로그수익률을 ufunc 한 번에 구한다.
+    prices = np.column_stack((left.values[idx_left], right.values[idx_right]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.log(prices[1:] / prices[:-1])
+    returns = returns[np.isfinite(returns).all(axis=1)]
+    return compute_correlation(returns[:, 0], returns[:, 1], window)
 
 
 def _append_note(base: str, extra: str) -> str:
@@ -235,466 +393,331 @@ def _validate_range(value: float, lower: float | None, upper: float | None) -> b
     return True
 
 
-def _record(
-    ts_kst: str,
+class _RecordColumns:
+    """compute_records 결과를 열(column)별 리스트로 모은다.
+
+    레코드마다 12개 키짜리 dict를 만들지 않고 값만 열에 쌓아 두었다가, 숫자 열 정리를
+    열 단위로 끝낸 뒤 ``to_records``에서 한 번에 dict 목록으로 바꾼다.
+    """
+
+    _FIELDS = SCHEMA_COLUMNS[1:]
+
+    def __init__(self, ts_kst: str) -> None:
+        self.ts_kst = ts_kst
+        self.columns: Dict[str, List[object]] = {column: [] for column in self._FIELDS}
+
+    def add(
+        self,
+        asset: str,
+        key: str,
+        value: float,
+        unit: str,
+        window: str,
+        change_abs: float,
+        change_pct: float,
+        source: str,
+        quality: str,
+        url: str,
+        notes: str = "",
+    ) -> None:
+        row = (
+            asset,
+            key,
+            value,
+            unit,
+            window,
+            change_abs,
+            change_pct,
+            source or "KIS",
+            quality or "primary",
+            url,
+            notes,
+        )
+        for column, item in zip(self.columns.values(), row):
+            column.append(item)
+
+    def to_records(self) -> List[Dict]:
+        # 숫자 열은 레코드마다 clip_numeric을 부르지 않고 열 단위 배열 연산으로 한 번에 정리한다.
+        for column in ("value", "change_abs", "change_pct"):
+            self.columns[column] = clip_numeric_array(self.columns[column])
+        return [
+            dict(zip(SCHEMA_COLUMNS, (self.ts_kst, *row)))
+            for row in zip(*self.columns.values())
+        ]
+
+
+_NAN = float("nan")
+
+# 범위를 벗어나면 값을 NaN으로 바꾸고 노트에 range_violation을 남길 (asset, key)별 하한/상한.
+_VALIDATION_RULES: Dict[Tuple[str, str], Tuple[Optional[float], Optional[float]]] = {
+    ("KOSPI", "advance"): (0.0, None),
+    ("KOSPI", "decline"): (0.0, None),
+    ("KOSPI", "unchanged"): (0.0, None),
+    ("KOSPI", "limit_up"): (0.0, None),
+    ("KOSPI", "limit_down"): (0.0, None),
+    ("KOSPI", "trading_value"): (0.0, None),
+    ("KOSPI", "trin"): (0.1, 10.0),
+    ("KOSDAQ", "advance"): (0.0, None),
+    ("KOSDAQ", "decline"): (0.0, None),
+    ("KOSDAQ", "unchanged"): (0.0, None),
+    ("DXY", "idx"): (70.0, 130.0),
+    ("UST2Y", "yield"): (0.0, 20.0),
+    ("UST10Y", "yield"): (0.0, 20.0),
+    ("KR3Y", "yield"): (0.0, 20.0),
+    ("KR10Y", "yield"): (0.0, 20.0),
+    ("2s10s_US", "spread"): (-300.0, 300.0),
+    ("2s10s_KR", "spread"): (-300.0, 300.0),
+}
+
+# 최신값/변화량/변화율을 그대로 내보내는 레코드: (asset, key, raw field, unit).
+# 출력 순서를 유지하려고 계산형 레코드 사이사이에 나눠 둔다.
+_INDEX_SPECS = (
+    ("KOSPI", "idx", "close", "pt"),
+    ("KOSDAQ", "idx", "close", "pt"),
+)
+_BREADTH_SPECS = (
+    ("KOSPI", "advance", "advance", "issues"),
+    ("KOSPI", "decline", "decline", "issues"),
+    ("KOSPI", "unchanged", "unchanged", "issues"),
+    ("KOSDAQ", "advance", "advance", "issues"),
+    ("KOSDAQ", "decline", "decline", "issues"),
+    ("KOSDAQ", "unchanged", "unchanged", "issues"),
+    ("KOSPI", "limit_up", "limit_up", "issues"),
+    ("KOSPI", "limit_down", "limit_down", "issues"),
+)
+_MACRO_SPECS = (
+    ("USD/KRW", "spot", "close", "KRW"),
+    ("DXY", "idx", "idx", "idx"),
+    ("UST2Y", "yield", "yield", "pct"),
+    ("UST10Y", "yield", "yield", "pct"),
+    ("KR3Y", "yield", "yield", "pct"),
+    ("KR10Y", "yield", "yield", "pct"),
+)
+_SPOT_SPECS = (
+    ("WTI", "spot", "close", "USD"),
+    ("Brent", "spot", "close", "USD"),
+    ("Gold", "spot", "close", "USD"),
+    ("Copper", "spot", "close", "USD"),
+    ("BTC", "spot", "close", "USD"),
+)
+# 2s10s 스프레드: (asset, long 자산, short 자산). 두 다리 모두 yield 필드를 쓴다.
+_SPREAD_SPECS = (
+    ("2s10s_US", "UST10Y", "UST2Y"),
+    ("2s10s_KR", "KR10Y", "KR3Y"),
+)
+
+
+def _add_simple(
+    records: _RecordColumns,
+    notes_map: Dict[Tuple[str, ...], str],
+    asset: str,
+    key: str,
+    bundle: SeriesBundle,
+    unit: str,
+) -> None:
+    value, change_abs, change_pct = bundle.stats
+    note_text = notes_map.get((asset, key), "")
+    bounds = _VALIDATION_RULES.get((asset, key), (None, None))
+    if not _validate_range(value, *bounds):
+        logger.debug(
+            "compute::add_simple :: %s %s out of range (value=%.4f, bounds=%s)",
+            asset,
+            key,
+            value,
+            bounds,
+        )
+        note_text = _append_note(note_text, "range_violation")
+        value = change_abs = change_pct = _NAN
+    records.add(
+        asset,
+        key,
+        value,
+        unit,
+        "1D",
+        change_abs,
+        change_pct,
+        bundle.source,
+        bundle.quality,
+        bundle.url,
+        notes=note_text,
+    )
+
+
+def _add_spread(
+    records: _RecordColumns,
+    notes_map: Dict[Tuple[str, ...], str],
+    asset: str,
+    long_leg: SeriesBundle,
+    short_leg: SeriesBundle,
+) -> None:
+    """미국/한국 2s10s 스프레드를 계산하고 디버깅 정보를 남긴다."""
+
+    key = "spread"
+    long_latest = long_leg.stats.latest
+    short_latest = short_leg.stats.latest
+    value = _NAN
+    note_text = notes_map.get((asset, key), "")
+    missing_parts: list[str] = []
+    if np.isnan(long_latest):
+        missing_parts.append(long_leg.asset)
+    if np.isnan(short_latest):
+        missing_parts.append(short_leg.asset)
+    if not missing_parts:
+        value = (long_latest - short_latest) * 100.0
+        _debug_value(f"{asset}:{key}", value, _abs_lt_1000)
+        note_text = _append_note(note_text, "ok")
+    else:
+        note_text = _append_note(
+            note_text,
+            f"upstream_missing:{'|'.join(sorted(missing_parts))}",
+        )
+    if not _validate_range(value, *_VALIDATION_RULES[(asset, key)]):
+        note_text = _append_note(note_text, "range_violation")
+        value = _NAN
+
+    # 소스는 최대 두 개뿐이라 set/sorted 없이 직접 정렬해 합친다(같으면 하나만 남긴다).
+    long_source, short_source = long_leg.source, short_leg.source
+    if long_source and short_source and long_source != short_source:
+        first, second = sorted((long_source, short_source))
+        combined_source = f"{first}+{second}"
+    else:
+        combined_source = long_source or short_source
+    combined_quality = long_leg.quality or short_leg.quality
+    if long_leg.url and short_leg.url:
+        combined_url = f"{long_leg.url} {short_leg.url}"
+    else:
+        combined_url = long_leg.url or short_leg.url
+
+    records.add(
+        asset,
+        key,
+        value,
+        "bp",
+        "1D",
+        _NAN,
+        _NAN,
+        combined_source or long_leg.source,
+        combined_quality,
+        combined_url,
+        notes=note_text,
+    )
+
+
+def _add_derived(
+    records: _RecordColumns,
+    notes_map: Dict[Tuple[str, ...], str],
     asset: str,
     key: str,
     value: float,
     unit: str,
     window: str,
-    change_abs: float,
-    change_pct: float,
-    source: str,
-    quality: str,
-    url: str,
-    notes: str = "",
-) -> Dict:
-    return {
-        "ts_kst": ts_kst,
-        "asset": asset,
-        "key": key,
-        "value": clip_numeric(value),
-        "unit": unit,
-        "window": window,
-        "change_abs": clip_numeric(change_abs),
-        "change_pct": clip_numeric(change_pct),
-        "source": source or "KIS",
-        "quality": quality or "primary",
-        "url": url,
-        "notes": notes,
-    }
+    bundle: SeriesBundle,
+) -> None:
+    """변화량이 없는 파생 지표(hv, basis, 수익률, 상관계수) 한 줄을 추가한다."""
+
+    records.add(
+        asset,
+        key,
+        value,
+        unit,
+        window,
+        _NAN,
+        _NAN,
+        bundle.source,
+        bundle.quality,
+        bundle.url,
+        notes=notes_map.get((asset, key), ""),
+    )
 
 
 def compute_records(ts, raw: Dict[str, pd.DataFrame], notes: Optional[Dict[str, str]] = None) -> List[Dict]:
-    ts_kst = ts_string(ts)
-    records: List[Dict] = []
-    notes_map = notes or {}
-
-    def note(asset: str, key: str) -> str:
-        return notes_map.get(f"{asset}:{key}", "")
-
-    kospi = _series_from_raw(raw, "KOSPI", "close")
-    kosdaq = _series_from_raw(raw, "KOSDAQ", "close")
-    k200 = _series_from_raw(raw, "K200", "close")
-    spx = _series_from_raw(raw, "SPX", "close")
-    ndx = _series_from_raw(raw, "NDX", "close")
-    sox = _series_from_raw(raw, "SOX", "close")
-    es = _series_from_raw(raw, "ES", "close")
-    nq = _series_from_raw(raw, "NQ", "close")
-    dxy_series = _series_from_raw(raw, "DXY", "idx")
-    usdkrw = _series_from_raw(raw, "USD/KRW", "close")
-    kr3y = _series_from_raw(raw, "KR3Y", "yield")
-    kr10y = _series_from_raw(raw, "KR10Y", "yield")
-    ust2y = _series_from_raw(raw, "UST2Y", "yield")
-    ust10y = _series_from_raw(raw, "UST10Y", "yield")
-
-    adv_kospi = _series_from_raw(raw, "KOSPI", "advance")
-    dec_kospi = _series_from_raw(raw, "KOSPI", "decline")
-    unch_kospi = _series_from_raw(raw, "KOSPI", "unchanged")
-    limit_up = _series_from_raw(raw, "KOSPI", "limit_up")
-    limit_down = _series_from_raw(raw, "KOSPI", "limit_down")
-    turnover = _series_from_raw(raw, "KOSPI", "trading_value")
-    trin_series = _series_from_raw(raw, "KOSPI", "trin")
-
-    adv_kosdaq = _series_from_raw(raw, "KOSDAQ", "advance")
-    dec_kosdaq = _series_from_raw(raw, "KOSDAQ", "decline")
-    unch_kosdaq = _series_from_raw(raw, "KOSDAQ", "unchanged")
-
-    btc = _series_from_raw(raw, "BTC", "close")
-    wti = _series_from_raw(raw, "WTI", "close")
-    brent = _series_from_raw(raw, "Brent", "close")
-    gold = _series_from_raw(raw, "Gold", "close")
-    copper = _series_from_raw(raw, "Copper", "close")
-
-    records.extend(
-        [
-            _record(
-                ts_kst,
-                "KOSPI",
-                "idx",
-                _latest(kospi.series),
-                "pt",
-                "1D",
-                _change(kospi.series),
-                _pct_change(kospi.series),
-                kospi.source,
-                kospi.quality,
-                kospi.url,
-                notes=note("KOSPI", "idx"),
-            ),
-            _record(
-                ts_kst,
-                "KOSDAQ",
-                "idx",
-                _latest(kosdaq.series),
-                "pt",
-                "1D",
-                _change(kosdaq.series),
-                _pct_change(kosdaq.series),
-                kosdaq.source,
-                kosdaq.quality,
-                kosdaq.url,
-                notes=note("KOSDAQ", "idx"),
-            ),
-        ]
-    )
+    records = _RecordColumns(ts_string(ts))
+    # "asset:key" 문자열 키를 한 번만 쪼개 두면 조회마다 f-string을 만들 필요가 없다.
+    notes_map = {tuple(name.split(":", 1)): text for name, text in (notes or {}).items()}
+    bundles = _index_raw(raw)
 
-    validation_rules = {
-        ("KOSPI", "advance"): (0.0, None),
-        ("KOSPI", "decline"): (0.0, None),
-        ("KOSPI", "unchanged"): (0.0, None),
-        ("KOSPI", "limit_up"): (0.0, None),
-        ("KOSPI", "limit_down"): (0.0, None),
-        ("KOSPI", "trading_value"): (0.0, None),
-        ("KOSPI", "trin"): (0.1, 10.0),
-        ("KOSDAQ", "advance"): (0.0, None),
-        ("KOSDAQ", "decline"): (0.0, None),
-        ("KOSDAQ", "unchanged"): (0.0, None),
-        ("DXY", "idx"): (70.0, 130.0),
-        ("UST2Y", "yield"): (0.0, 20.0),
-        ("UST10Y", "yield"): (0.0, 20.0),
-        ("KR3Y", "yield"): (0.0, 20.0),
-        ("KR10Y", "yield"): (0.0, 20.0),
-        ("2s10s_US", "spread"): (-300.0, 300.0),
-        ("2s10s_KR", "spread"): (-300.0, 300.0),
-    }
-
-    def add_simple(asset: str, key: str, bundle: SeriesBundle, unit: str = "count") -> None:
-        value = _latest(bundle.series)
-        change_abs = _change(bundle.series)
-        change_pct = _pct_change(bundle.series)
-        note_text = note(asset, key)
-        bounds = validation_rules.get((asset, key), (None, None))
-        if not _validate_range(value, *bounds):
-            logger.debug(
-                "compute::add_simple :: %s %s out of range (value=%.4f, bounds=%s)",
-                asset,
-                key,
-                value,
-                bounds,
-            )
-            note_text = _append_note(note_text, "range_violation")
-            value = float("nan")
-            change_abs = float("nan")
-            change_pct = float("nan")
-        records.append(
-            _record(
-                ts_kst,
-                asset,
-                key,
-                value,
-                unit,
-                "1D",
-                change_abs,
-                change_pct,
-                bundle.source,
-                bundle.quality,
-                bundle.url,
-                notes=note_text,
-            )
-        )
+    def bundle(asset: str, field: str) -> SeriesBundle:
+        return _series_from_raw(bundles, asset, field)
+
+    for asset, key, field, unit in _INDEX_SPECS + _BREADTH_SPECS:
+        _add_simple(records, notes_map, asset, key, bundle(asset, field), unit)
 
-    add_simple("KOSPI", "advance", adv_kospi, unit="issues")
-    add_simple("KOSPI", "decline", dec_kospi, unit="issues")
-    add_simple("KOSPI", "unchanged", unch_kospi, unit="issues")
-    add_simple("KOSDAQ", "advance", adv_kosdaq, unit="issues")
-    add_simple("KOSDAQ", "decline", dec_kosdaq, unit="issues")
-    add_simple("KOSDAQ", "unchanged", unch_kosdaq, unit="issues")
-    add_simple("KOSPI", "limit_up", limit_up, unit="issues")
-    add_simple("KOSPI", "limit_down", limit_down, unit="issues")
-
-    trin_value = _latest(trin_series.series)
-    trin_note = note("KOSPI", "trin")
+    trin_series = bundle("KOSPI", "trin")
+    trin_value = trin_series.stats.latest
+    trin_note = notes_map.get(("KOSPI", "trin"), "")
     if not np.isnan(trin_value):
-        if not _validate_range(trin_value, *validation_rules[("KOSPI", "trin")]):
+        if not _validate_range(trin_value, *_VALIDATION_RULES[("KOSPI", "trin")]):
             trin_note = _append_note(trin_note, "range_violation")
-            trin_value = float("nan")
+            trin_value = _NAN
     elif not trin_note:
         trin_note = "upstream_missing:krx_trin"
-    records.append(
-        _record(
-            ts_kst,
-            "KOSPI",
-            "trin",
-            trin_value,
-            "ratio",
-            "1D",
-            float("nan"),
-            float("nan"),
-            trin_series.source,
-            trin_series.quality,
-            trin_series.url,
-            notes=trin_note,
-        )
+    records.add(
+        "KOSPI",
+        "trin",
+        trin_value,
+        "ratio",
+        "1D",
+        _NAN,
+        _NAN,
+        trin_series.source,
+        trin_series.quality,
+        trin_series.url,
+        notes=trin_note,
     )
 
-    trading_note = note("KOSPI", "trading_value")
-    trading_value = _latest(turnover.series)
-    if not _validate_range(trading_value, *validation_rules[("KOSPI", "trading_value")]):
+    turnover = bundle("KOSPI", "trading_value")
+    trading_note = notes_map.get(("KOSPI", "trading_value"), "")
+    trading_value, trading_change, trading_pct = turnover.stats
+    if not _validate_range(trading_value, *_VALIDATION_RULES[("KOSPI", "trading_value")]):
         trading_note = _append_note(trading_note, "range_violation")
-        trading_value = float("nan")
-    records.append(
-        _record(
-            ts_kst,
-            "KOSPI",
-            "trading_value",
-            trading_value,
-            "KRW",
-            "1D",
-            _change(turnover.series),
-            _pct_change(turnover.series),
-            turnover.source,
-            turnover.quality,
-            turnover.url,
-            notes=trading_note,
-        )
-    )
-
-    hv30 = rolling_vol(k200.series, 30)
-    records.append(
-        _record(
-            ts_kst,
-            "K200",
-            "hv30",
-            hv30,
-            "vol",
-            "30D",
-            float("nan"),
-            float("nan"),
-            k200.source,
-            k200.quality,
-            k200.url,
-            notes=note("K200", "hv30"),
-        )
+        trading_value = _NAN
+    records.add(
+        "KOSPI",
+        "trading_value",
+        trading_value,
+        "KRW",
+        "1D",
+        trading_change,
+        trading_pct,
+        turnover.source,
+        turnover.quality,
+        turnover.url,
+        notes=trading_note,
     )
 
-    def returns(series: pd.Series, window: int) -> float:
-        if len(series) <= window:
-            return float("nan")
-        return float(series.iloc[-1] / series.iloc[-window - 1] - 1)
+    k200 = bundle("K200", "close")
+    es, nq, sox = bundle("ES", "close"), bundle("NQ", "close"), bundle("SOX", "close")
+    _add_derived(records, notes_map, "K200", "hv30", rolling_vol(k200.values, 30), "vol", "30D", k200)
+    _add_derived(records, notes_map, "ES", "basis", _basis(es, bundle("SPX", "close")), "ratio", "1D", es)
+    _add_derived(records, notes_map, "NQ", "basis", _basis(nq, bundle("NDX", "close")), "ratio", "1D", nq)
+    _add_derived(records, notes_map, "SOX", "ret_1w", _returns(sox.values, 5), "return", "1W", sox)
+    _add_derived(records, notes_map, "SOX", "ret_1m", _returns(sox.values, 21), "return", "1M", sox)
 
-    def basis(fut: pd.Series, spot: pd.Series) -> float:
-        if fut.empty or spot.empty:
-            return float("nan")
-        return float(fut.iloc[-1] / spot.iloc[-1] - 1)
-
-    records.extend(
-        [
-            _record(
-                ts_kst,
-                "ES",
-                "basis",
-                basis(es.series, spx.series),
-                "ratio",
-                "1D",
-                float("nan"),
-                float("nan"),
-                es.source,
-                es.quality,
-                es.url,
-                notes=note("ES", "basis"),
-            ),
-            _record(
-                ts_kst,
-                "NQ",
-                "basis",
-                basis(nq.series, ndx.series),
-                "ratio",
-                "1D",
-                float("nan"),
-                float("nan"),
-                nq.source,
-                nq.quality,
-                nq.url,
-                notes=note("NQ", "basis"),
-            ),
-            _record(
-                ts_kst,
-                "SOX",
-                "ret_1w",
-                returns(sox.series, 5),
-                "return",
-                "1W",
-                float("nan"),
-                float("nan"),
-                sox.source,
-                sox.quality,
-                sox.url,
-                notes=note("SOX", "ret_1w"),
-            ),
-            _record(
-                ts_kst,
-                "SOX",
-                "ret_1m",
-                returns(sox.series, 21),
-                "return",
-                "1M",
-                float("nan"),
-                float("nan"),
-                sox.source,
-                sox.quality,
-                sox.url,
-                notes=note("SOX", "ret_1m"),
-            ),
-        ]
-    )
-
-    add_simple("USD/KRW", "spot", usdkrw, unit="KRW")
-    add_simple("DXY", "idx", dxy_series, unit="idx")
-
-    def yield_record(bundle: SeriesBundle, asset: str) -> None:
-        key = "yield"
-        base_note = note(asset, key)
-        value = _latest(bundle.series)
-        change_abs = _change(bundle.series)
-        change_pct = _pct_change(bundle.series)
-        bounds = validation_rules.get((asset, key), (None, None))
-        if not _validate_range(value, *bounds):
-            base_note = _append_note(base_note, "range_violation")
-            value = float("nan")
-            change_abs = float("nan")
-            change_pct = float("nan")
-        records.append(
-            _record(
-                ts_kst,
-                asset,
-                key,
-                value,
-                "pct",
-                "1D",
-                change_abs,
-                change_pct,
-                bundle.source,
-                bundle.quality,
-                bundle.url,
-                notes=base_note,
-            )
-        )
-
-    yield_record(ust2y, "UST2Y")
-    yield_record(ust10y, "UST10Y")
-    yield_record(kr3y, "KR3Y")
-    yield_record(kr10y, "KR10Y")
-
-    def add_spread(
-        asset: str,
-        key: str,
-        long_leg: SeriesBundle,
-        long_name: str,
-        short_leg: SeriesBundle,
-        short_name: str,
-    ) -> None:
-        """미국/한국 2s10s 스프레드를 계산하고 디버깅 정보를 남긴다."""
-
-        long_latest = _latest(long_leg.series)
-        short_latest = _latest(short_leg.series)
-        value = float("nan")
-        note_text = note(asset, key)
-        missing_parts: list[str] = []
-        if np.isnan(long_latest):
-            missing_parts.append(long_name)
-        if np.isnan(short_latest):
-            missing_parts.append(short_name)
-        if not missing_parts:
-            value = (long_latest - short_latest) * 100.0
-            _debug_value(f"{asset}:{key}", value, lambda v: abs(v) < 1000)
-            note_text = _append_note(note_text, "ok")
-        else:
-            note_text = _append_note(
-                note_text,
-                f"upstream_missing:{'|'.join(sorted(missing_parts))}",
-            )
-        if not _validate_range(value, *validation_rules[(asset, key)]):
-            note_text = _append_note(note_text, "range_violation")
-            value = float("nan")
-
-        combined_source = "+".join(
-            sorted(
-                {
-                    src
-                    for src in [long_leg.source, short_leg.source]
-                    if src
-                }
-            )
-        )
-        combined_quality = long_leg.quality or short_leg.quality
-        combined_url = " ".join(
-            [part for part in [long_leg.url, short_leg.url] if part]
-        )
+    for asset, key, field, unit in _MACRO_SPECS:
+        _add_simple(records, notes_map, asset, key, bundle(asset, field), unit)
 
-        records.append(
-            _record(
-                ts_kst,
-                asset,
-                key,
-                value,
-                "bp",
-                "1D",
-                float("nan"),
-                float("nan"),
-                combined_source or long_leg.source,
-                combined_quality,
-                combined_url,
-                notes=note_text,
-            )
-        )
+    for asset, long_asset, short_asset in _SPREAD_SPECS:
+        _add_spread(records, notes_map, asset, bundle(long_asset, "yield"), bundle(short_asset, "yield"))
 
-    add_spread("2s10s_US", "spread", ust10y, "UST10Y", ust2y, "UST2Y")
-    add_spread("2s10s_KR", "spread", kr10y, "KR10Y", kr3y, "KR3Y")
-
-    for bundle, asset, unit in [
-        (wti, "WTI", "USD"),
-        (brent, "Brent", "USD"),
-        (gold, "Gold", "USD"),
-        (copper, "Copper", "USD"),
-        (btc, "BTC", "USD"),
-    ]:
-        records.append(
-            _record(
-                ts_kst,
-                asset,
-                "spot",
-                _latest(bundle.series),
-                unit,
-                "1D",
-                _change(bundle.series),
-                _pct_change(bundle.series),
-                bundle.source,
-                bundle.quality,
-                bundle.url,
-                notes=note(asset, "spot"),
-            )
-        )
+    for asset, key, field, unit in _SPOT_SPECS:
+        _add_simple(records, notes_map, asset, key, bundle(asset, field), unit)
 
-    btc_corr = rolling_corr(
-        np.log(btc.series).diff().dropna(),
-        np.log(nq.series).diff().dropna(),
-        20,
-    )
-    records.append(
-        _record(
-            ts_kst,
-            "BTC",
-            "corr20",
-            btc_corr,
-            "corr",
-            "20D",
-            float("nan"),
-            float("nan"),
-            btc.source,
-            btc.quality,
-            btc.url,
-            notes=note("BTC", "corr20"),
-        )
-    )
+    btc = bundle("BTC", "close")
+    _add_derived(records, notes_map, "BTC", "corr20", _log_return_corr(btc, nq, 20), "corr", "20D", btc)
 
-    return records
+    # 레코드마다 검사하지 않고, 완성된 묶음의 키 구성과 quality 값을 한 번에 확인한다.
+    return ensure_schema_batch(records.to_records())
 
 
 def check_coverage(records: Iterable[Dict]) -> float:
-    filled = {
-        f"{row.get('asset')}:{row.get('key')}"
-        for row in records
-        if row.get("value") not in (None, "")
-    }
-    return len(filled.intersection(set(REQUIRED_KEYS))) / max(1, len(REQUIRED_KEYS))
+    # 필수 키만 모으고, 전부 채워지면 남은 레코드는 보지 않는다.
+    filled = set()
+    for row in records:
+        if row.get("value") in (None, ""):
+            continue
+        name = f"{row.get('asset')}:{row.get('key')}"
+        if name in _REQUIRED_KEY_SET:
+            filled.add(name)
+            if len(filled) == len(_REQUIRED_KEY_SET):
+                break
+    return len(filled) / max(1, len(_REQUIRED_KEY_SET))
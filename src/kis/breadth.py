@@ -2,32 +2,72 @@ from __future__ import annotations
 
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 
 def adv_dec_unch(snapshots: pd.DataFrame) -> Dict[str, pd.Series]:
-    grouped = snapshots.groupby("market")
-    adv_mask = grouped["change"].apply(lambda s: (s > 0).sum())
-    dec_mask = grouped["change"].apply(lambda s: (s < 0).sum())
-    unch_mask = grouped["change"].apply(lambda s: (s == 0).sum())
-    adv_value = snapshots.loc[snapshots["change"] > 0].groupby("market")["value_traded"].sum()
-    dec_value = snapshots.loc[snapshots["change"] < 0].groupby("market")["value_traded"].sum()
-    limit_up = grouped["limit_flag"].apply(lambda s: (s == "upper").sum())
-    limit_down = grouped["limit_flag"].apply(lambda s: (s == "lower").sum())
-    markets = sorted(snapshots["market"].unique())
-    result = {
-        "adv_count": adv_mask.reindex(markets, fill_value=0),
-        "dec_count": dec_mask.reindex(markets, fill_value=0),
-        "unch_count": unch_mask.reindex(markets, fill_value=0),
-        "adv_value": adv_value.reindex(markets, fill_value=0),
-        "dec_value": dec_value.reindex(markets, fill_value=0),
-        "limit_up": limit_up.reindex(markets, fill_value=0),
-        "limit_down": limit_down.reindex(markets, fill_value=0),
+    """시장별 상승/하락/보합 종목 수, 상승/하락 거래대금, 상·하한가 수를 센다.
+
+    market과 limit_flag는 범주 코드(int)로 바꿔 두고, 조건마다 groupby.apply(lambda)를
+    돌리는 대신 코드별 ``np.bincount`` 합계로 한 번에 집계한다.
+    """
+
+    market_codes, markets = pd.factorize(snapshots["market"], sort=True)
+    flag_codes, flags = pd.factorize(snapshots["limit_flag"])
+    change = snapshots["change"].to_numpy(dtype=np.float64)
+    value_traded = snapshots["value_traded"].to_numpy()
+    if value_traded.dtype.kind == "f":
+        # groupby.sum처럼 결측 거래대금은 0으로 보고 더한다.
+        value_traded = np.where(np.isnan(value_traded), 0.0, value_traded)
+    adv = change > 0
+    dec = change < 0
+    indicators = {
+        "adv_count": adv,
+        "dec_count": dec,
+        "unch_count": change == 0,
+        "adv_value": np.where(adv, value_traded, 0),
+        "dec_value": np.where(dec, value_traded, 0),
+        "limit_up": flag_codes == _code_of(flags, "upper"),
+        "limit_down": flag_codes == _code_of(flags, "lower"),
     }
+
+    grouped = market_codes >= 0
+    codes = market_codes[grouped]
+    index = pd.Index(markets, name="market")
+    result: Dict[str, pd.Series] = {}
+    for name, column in indicators.items():
+        totals = np.bincount(codes, weights=column[grouped], minlength=len(markets))
+        if column.dtype.kind in "bi":
+            totals = totals.astype(np.int64)
+        result[name] = pd.Series(totals, index=index, name=name)
     return result
 
 
-def trin(adv_cnt: float, dec_cnt: float, adv_val: float, dec_val: float) -> float:
-    if dec_cnt == 0 or dec_val == 0:
-        return float("nan")
-    return (adv_cnt / dec_cnt) / (adv_val / dec_val)
+def _code_of(categories: pd.Index, label: str) -> int:
+    # 없는 라벨은 어떤 코드와도 같지 않은 -2를 돌려 마스크가 전부 False가 되게 한다.
+    return categories.get_loc(label) if label in categories else -2
+
+
+def trin(
+    adv_cnt: float | pd.Series | np.ndarray,
+    dec_cnt: float | pd.Series | np.ndarray,
+    adv_val: float | pd.Series | np.ndarray,
+    dec_val: float | pd.Series | np.ndarray,
+) -> float | pd.Series | np.ndarray:
+    """TRIN = (상승/하락 종목 수) / (상승/하락 거래대금).
+
+    스칼라뿐 아니라 ``adv_dec_unch``가 돌려준 시장별 Series도 그대로 받아 한 번에 계산한다.
+    하락 종목 수나 하락 거래대금이 0인 자리는 NaN이다.
+    """
+
+    adv_c, dec_c, adv_v, dec_v = (
+        np.asarray(arg, dtype=np.float64) for arg in (adv_cnt, dec_cnt, adv_val, dec_val)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where((dec_c == 0) | (dec_v == 0), np.nan, (adv_c / dec_c) / (adv_v / dec_v))
+    if result.ndim == 0:
+        return float(result)
+    if isinstance(adv_cnt, pd.Series):
+        return pd.Series(result, index=adv_cnt.index)
+    return result
@@ -3,42 +3,163 @@ from __future__ import annotations
 import json
 import logging
 import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, time
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import yfinance as yf
 from pykrx import bond, stock
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
 from ..utils import KST, kst_now
 
+try:  # pragma: no cover - orjson 설치 여부에 따라 달라짐
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# KIS 조회 실패로 보고 폴백으로 넘어갈 예외들. _rest의 재시도가 모두 실패하면 RetryError가 올라오고,
+# OSError는 토큰 캐시 파일 입출력 실패를 다룬다. 그 밖의 예외는 코드 버그일 가능성이 높으므로 그대로 올린다.
+_FETCH_ERRORS = (requests.RequestException, RetryError, OSError, ValueError, KeyError, RuntimeError)
+
+# 만료 직전 토큰으로 요청하지 않도록 이 시간만큼 여유를 두고 재발급한다.
+_REFRESH_SKEW = timedelta(minutes=2)
+
+# pykrx 장외 국고채 수익률 표에서 만기별로 찾아볼 컬럼 이름 후보.
+_PYKRX_YIELD_CANDIDATES = {
+    "kr3y": ("국고채(3년)", "3년", "3년물", "3Y", "3-year", "국채3년"),
+    "kr10y": ("국고채(10년)", "10년", "10년물", "10Y", "10-year", "국채10년"),
+}
+
+# KIS 응답마다 컬럼 이름이 달라 설정에 지정된 컬럼이 없을 때 차례로 찾아보는 후보들.
+_DATE_CANDIDATES = ("stck_bsop_date", "bsop_date", "bas_dt", "base_date", "biz_dt", "xymd", "trd_dd", "date")
+_TIME_CANDIDATES = ("stck_bsop_time", "hhmm", "time", "cntg_hour", "tm")
+_VALUE_CANDIDATES = (
+    "stck_prpr",
+    "stck_clpr",
+    "clpr",
+    "clos",
+    "close",
+    "ovrs_prpr",
+    "ovrs_clpr",
+    "last",
+    "deal_prc",
+    "prpr",
+    "idx_clpr",
+)
+
+
+def _json_loads(raw: bytes) -> Any:
+    # orjson이 있으면 바이트를 바로 파싱하고, 없으면 표준 json으로 처리한다.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    # 쓰는 도중 프로세스가 죽어도 깨진 캐시가 남지 않도록 임시 파일에 쓴 뒤 교체한다.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as fh:
+        fh.write(data)
+    os.replace(fh.name, path)
+
 
 def _to_kst_index(index: pd.Index) -> pd.DatetimeIndex:
-    idx = pd.DatetimeIndex(index)
+    # 이미 DatetimeIndex면 다시 만들지 않고, 이미 KST면 변환 없이 그대로 돌려준다.
+    idx = index if isinstance(index, pd.DatetimeIndex) else pd.DatetimeIndex(index)
     if idx.tz is None:
-        idx = idx.tz_localize("UTC")
+        return idx.tz_localize("UTC").tz_convert(KST)
+    if idx.tz is KST:
+        return idx
     return idx.tz_convert(KST)
 
 
+def _constant_column(value: str, length: int) -> pd.Categorical:
+    """행마다 같은 문자열(source/quality/url)을 코드 배열 하나와 범주 하나로 표현한다."""
+
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+
 def _merge_frames(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     if not frames:
         return pd.DataFrame()
-    merged = None
-    for key, frame in frames.items():
-        temp = frame.set_index("ts_kst")["value"].rename(key)
-        merged = temp.to_frame() if merged is None else merged.join(temp, how="outer")
-    merged = merged.sort_index().dropna(how="all")
-    merged = merged.tail(120)
+    # 시리즈마다 join을 반복하면 인덱스 합집합과 프레임 복사가 매번 일어나므로 한 번에 붙인다.
+    series = [frame.set_index("ts_kst")["value"].rename(key) for key, frame in frames.items()]
+    merged = pd.concat(series, axis=1, join="outer", copy=False)
+    if not merged.index.is_monotonic_increasing:
+        merged = merged.sort_index()
+    merged = merged.dropna(how="all").iloc[-120:]
     merged = merged.reset_index()
     return merged
 
 
+def _with_override(field: Optional[str], defaults: Tuple[str, ...]) -> Tuple[str, ...]:
+    # 설정에 컬럼 이름이 있으면 기본 후보보다 먼저 본다.
+    return (field, *defaults) if field else defaults
+
+
+@dataclass(slots=True, frozen=True)
+class _SeriesPlan:
+    """conf.yml의 KIS 시리즈 설정을 요청마다 다시 찾지 않도록 미리 풀어 둔 요청 계획."""
+
+    path: str
+    endpoint: str
+    tr_id: str
+    method: str
+    params: Dict[str, Any]
+    period_param: str
+    json_body: Optional[Dict[str, Any]]
+    result_path: Optional[str]
+    unit: str
+    source: Any
+    quality: Any
+    url: str
+    cache_ttl: float
+    date_candidates: Tuple[str, ...]
+    time_candidates: Tuple[str, ...]
+    value_candidates: Tuple[str, ...]
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any], api_domain: str) -> "_SeriesPlan":
+        path = meta.get("path") or ""
+        return cls(
+            path=path,
+            endpoint=f"{api_domain}{path}",
+            tr_id=meta.get("tr_id", ""),
+            method=meta.get("method", "GET"),
+            params=dict(meta.get("params") or {}),
+            period_param=meta.get("period_param") or "",
+            json_body=meta.get("json"),
+            result_path=meta.get("result_path"),
+            unit=meta.get("unit") or "",
+            source=meta.get("source", "KIS"),
+            quality=meta.get("quality", "primary"),
+            url=meta.get("url") or "",
+            cache_ttl=float(meta.get("cache_ttl", 0) or 0),
+            date_candidates=_with_override(meta.get("date_field"), _DATE_CANDIDATES),
+            time_candidates=_with_override(meta.get("time_field"), _TIME_CANDIDATES),
+            value_candidates=_with_override(meta.get("value_field"), _VALUE_CANDIDATES),
+        )
+
+
 @dataclass
 class KISClient:
     config: Dict[str, Any]
@@ -47,50 +168,88 @@ class KISClient:
         kis_cfg = self.config.get("kis", {})
         self.mode = kis_cfg.get("mode", "auto")
         self.token_cache = Path(kis_cfg.get("token_cache", "cache/kis_token.json"))
+        self.pykrx_yield_cache = Path(kis_cfg.get("pykrx_yield_cache", "cache/pykrx_yields.json"))
+        self.yield_cache_dir = Path(kis_cfg.get("yield_cache_dir", "cache/yields"))
         self.appkey = os.getenv(kis_cfg.get("appkey_env", ""), "")
         self.appsecret = os.getenv(kis_cfg.get("appsecret_env", ""), "")
+        # 모드와 키는 실행 중에 바뀌지 않으므로 실시간 사용 여부를 한 번만 정해 둔다.
+        # simulation이면 항상 끄고, live/auto는 키가 모두 있을 때만 실시간으로 조회한다.
+        self.use_live = self.mode != "simulation" and bool(self.appkey and self.appsecret)
         self.fallback = self.config.get("fallback", {})
         self.series_meta = kis_cfg.get("series", {})
         self.base_url = kis_cfg.get("rest_base_url", kis_cfg.get("base_url", "https://openapi.koreainvestment.com:9443"))
         self.api_domain = kis_cfg.get("api_domain", self.base_url)
+        self._plans: Dict[Tuple[str, str], _SeriesPlan] = {
+            (group, name): _SeriesPlan.from_meta(meta, self.api_domain)
+            for group, section in self.series_meta.items()
+            for name, meta in (section or {}).items()
+            if meta
+        }
         self.token_url = kis_cfg.get("token_url", f"{self.base_url}/oauth2/tokenP")
         self.session = requests.Session()
+        # 심볼마다 순차 호출하므로 연결을 재사용해 TLS 핸드셰이크를 줄인다. 재시도는 tenacity가 맡는다.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+        # ECOS 요청도 같은 세션을 쓰므로 KIS 인증 헤더는 세션 기본값에 넣지 않고 따로 들고 있는다.
+        self._static_headers = {"appkey": self.appkey, "appsecret": self.appsecret, "custtype": "P"}
+        self._header_token: Optional[Dict[str, Any]] = None
+        self._header_template: Dict[str, str] = {}
         self._cached_token: Optional[Dict[str, Any]] = None
+        # 메모리 캐시 토큰의 갱신 시점(time.monotonic 기준). 요청마다 datetime을 만들지 않도록 쓴다.
+        self._cached_deadline = 0.0
+        self._tried_disk = False
+        # (만료 시각, 응답) LRU. 스레드 풀에서 동시에 접근하므로 잠금을 함께 둔다.
+        self._resp_cache: OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._resp_cache_size = max(1, int(kis_cfg.get("response_cache_size", 256)))
+        self._resp_lock = threading.Lock()
+        self._yf_cache: Dict[Tuple[str, Any], pd.DataFrame] = {}
+        self.max_workers = max(1, int(kis_cfg.get("max_workers", 4)))
         self.symbol_not_found: set[str] = set()
         self.yield_failure_meta: Dict[str, Dict[str, str]] = {}
 
-    @property
-    def use_live(self) -> bool:
-        if self.mode == "simulation":
-            return False
-        if self.mode == "live":
-            return bool(self.appkey and self.appsecret)
-        # auto 모드: 키가 존재하면 실시간 사용
-        return bool(self.appkey and self.appsecret)
-
     def get_token(self) -> Dict[str, Any]:
         if not self.use_live:
             return {"access_token": "simulation", "expires_at": (datetime.utcnow() + timedelta(hours=1)).isoformat()}
-        if self._cached_token is None and self.token_cache.exists():
-            with self.token_cache.open("r", encoding="utf-8") as fh:
-                cached = json.load(fh)
-            expires_at = cached.get("expires_at")
-            if expires_at and datetime.fromisoformat(expires_at) > datetime.utcnow() + timedelta(minutes=2):
-                self._cached_token = cached
-        if self._cached_token and datetime.fromisoformat(self._cached_token["expires_at"]) > datetime.utcnow() + timedelta(minutes=2):
+        # 만료 시각은 토큰을 읽거나 받을 때 한 번만 파싱해 두고, 요청마다 monotonic 시계와만 비교한다.
+        if self._cached_token is not None and monotonic() < self._cached_deadline:
             return self._cached_token
+        if self._cached_token is None and not self._tried_disk:
+            # 디스크 캐시는 프로세스당 한 번만 확인한다. 이후에는 메모리 캐시나 재발급으로 처리한다.
+            self._tried_disk = True
+            # 파일이 없거나 깨졌거나 expires_at 형식이 이상하면 캐시가 없는 것으로 보고 새로 발급받는다.
+            try:
+                cached = _json_loads(self.token_cache.read_bytes())
+                expires_at = cached.get("expires_at")
+                if expires_at and self._remember_token(cached, datetime.fromisoformat(expires_at)):
+                    return cached
+            except (OSError, ValueError, TypeError, AttributeError) as exc:
+                if not isinstance(exc, FileNotFoundError):
+                    logger.debug("KIS 토큰 캐시를 읽지 못해 새로 발급받습니다: %s", exc)
         token = self._request_token()
-        self._cached_token = token
-        self.token_cache.parent.mkdir(parents=True, exist_ok=True)
-        with self.token_cache.open("w", encoding="utf-8") as fh:
-            json.dump(token, fh)
+        self._remember_token(token, datetime.fromisoformat(token["expires_at"]))
+        self._write_token_cache(token)
         return token
 
+    def _write_token_cache(self, token: Dict[str, Any]) -> None:
+        _write_bytes_atomic(self.token_cache, _json_dumps(token))
+
+    def _remember_token(self, token: Dict[str, Any], expiry: datetime) -> bool:
+        """토큰을 메모리에 올리고, 갱신 여유를 뺀 남은 시간을 monotonic 마감 시각으로 바꿔 둔다."""
+
+        remaining = (expiry - datetime.utcnow() - _REFRESH_SKEW).total_seconds()
+        if remaining <= 0:
+            return False
+        self._cached_token = token
+        self._cached_deadline = monotonic() + remaining
+        return True
+
     def _request_token(self) -> Dict[str, Any]:
         payload = {"grant_type": "client_credentials", "appkey": self.appkey, "appsecret": self.appsecret}
         response = self.session.post(self.token_url, json=payload, timeout=15)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         access_token = data.get("access_token")
         if not access_token:
             raise RuntimeError(f"KIS token 응답 오류: {data}")
@@ -103,19 +262,45 @@ class KISClient:
     # ------------------------------------------------------------------
     def _auth_headers(self, tr_id: str) -> Dict[str, str]:
         token = self.get_token()
-        return {
-            "Authorization": f"Bearer {token['access_token']}",
-            "appkey": self.appkey,
-            "appsecret": self.appsecret,
-            "tr_id": tr_id,
-            "custtype": "P",
-        }
+        if token is not self._header_token:
+            # 토큰이 바뀔 때만 Authorization 문자열을 다시 만들고, 요청마다는 tr_id만 채운다.
+            self._header_template = {**self._static_headers, "Authorization": f"Bearer {token['access_token']}"}
+            self._header_token = token
+        headers = dict(self._header_template)
+        headers["tr_id"] = tr_id
+        return headers
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=4))
-    def _rest(self, method: str, path: str, *, params: Optional[Dict[str, Any]] = None, json_body: Optional[Dict[str, Any]] = None, tr_id: str) -> Dict[str, Any]:
+    def _rest(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        tr_id: str,
+        cache_ttl: float = 0.0,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any]:
         if not self.use_live:
             raise RuntimeError("live 모드가 아님")
-        url = f"{self.api_domain}{path}"
+        cache_key: Optional[Tuple[Any, ...]] = None
+        if cache_ttl > 0:
+            # 같은 조회를 TTL 안에 다시 보내면 HTTP 왕복 없이 직전 응답을 돌려준다.
+            cache_key = (
+                method.upper(),
+                path,
+                tuple(sorted((params or {}).items())),
+                json.dumps(json_body, sort_keys=True) if json_body is not None else None,
+                tr_id,
+            )
+            with self._resp_lock:
+                cached = self._resp_cache.get(cache_key)
+                if cached is not None and monotonic() < cached[0]:
+                    self._resp_cache.move_to_end(cache_key)
+                    return cached[1]
+        if url is None:
+            url = f"{self.api_domain}{path}"
         response = self.session.request(
             method.upper(),
             url,
@@ -125,106 +310,109 @@ class KISClient:
             timeout=15,
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         if data.get("rt_cd") not in (None, "0"):
             raise RuntimeError(f"KIS 응답 오류: {data}")
+        if cache_key is not None:
+            self._store_response(cache_key, data, cache_ttl)
         return data
 
+    def _store_response(self, cache_key: Tuple[Any, ...], data: Dict[str, Any], ttl: float) -> None:
+        # 넣을 때 만료된 항목을 먼저 지우고, 그래도 넘치면 가장 오래 안 쓴 항목부터 버린다.
+        now = monotonic()
+        with self._resp_lock:
+            for key in [key for key, (expires, _) in self._resp_cache.items() if expires <= now]:
+                del self._resp_cache[key]
+            self._resp_cache[cache_key] = (now + ttl, data)
+            self._resp_cache.move_to_end(cache_key)
+            while len(self._resp_cache) > self._resp_cache_size:
+                self._resp_cache.popitem(last=False)
+
     @staticmethod
-    def _pick_column(frame: pd.DataFrame, candidates: list[str]) -> Optional[pd.Series]:
+    def _pick_column(frame: pd.DataFrame, columns: Set[str], candidates: Tuple[str, ...]) -> Optional[pd.Series]:
         for col in candidates:
-            if col in frame.columns:
+            if col in columns:
                 series = frame[col]
                 if series.notna().any():
                     return series
         return None
 
-    def _normalize_timeseries(self, items: Any, periods: int, meta: Dict[str, Any]) -> pd.DataFrame:
+    def _normalize_timeseries(self, items: Any, periods: int, plan: _SeriesPlan) -> pd.DataFrame:
         frame = pd.DataFrame(items)
         if frame.empty:
             raise ValueError("빈 데이터")
-        date_candidates = [meta.get("date_field")] if meta.get("date_field") else []
-        date_candidates += [
-            "stck_bsop_date",
-            "bsop_date",
-            "bas_dt",
-            "base_date",
-            "biz_dt",
-            "xymd",
-            "trd_dd",
-            "date",
-        ]
-        time_candidates = [meta.get("time_field")] if meta.get("time_field") else []
-        time_candidates += ["stck_bsop_time", "hhmm", "time", "cntg_hour", "tm"]
-        value_candidates = [meta.get("value_field")] if meta.get("value_field") else []
-        value_candidates += [
-            "stck_prpr",
-            "stck_clpr",
-            "clpr",
-            "clos",
-            "close",
-            "ovrs_prpr",
-            "ovrs_clpr",
-            "last",
-            "deal_prc",
-            "prpr",
-            "idx_clpr",
-        ]
-
-        date_series = None
-        for col in date_candidates:
-            if col and col in frame.columns:
-                date_series = frame[col]
-                break
-        if date_series is None:
+        # 후보 목록은 요청 계획에 미리 만들어 두고, 컬럼 존재 여부는 집합으로 확인한다.
+        columns = set(frame.columns)
+        date_col = next((col for col in plan.date_candidates if col in columns), None)
+        if date_col is None:
             raise ValueError("날짜 컬럼을 찾을 수 없습니다")
+        date_series = frame[date_col]
 
-        time_series = None
-        for col in time_candidates:
-            if col and col in frame.columns:
-                time_series = frame[col]
-                break
+        time_col = next((col for col in plan.time_candidates if col in columns), None)
+        time_series = frame[time_col] if time_col is not None else None
 
-        value_series = self._pick_column(frame, [c for c in value_candidates if c])
+        value_series = self._pick_column(frame, columns, plan.value_candidates)
         if value_series is None:
             raise ValueError("값 컬럼을 찾을 수 없습니다")
 
-        ts = date_series.astype(str).str.replace("-", "")
+        dates = date_series.astype(str).to_numpy(dtype=str)
         if time_series is not None:
-            hhmm = time_series.astype(str).str.zfill(6).str[:6]
-            ts = ts + hhmm
-            parsed = pd.to_datetime(ts, format="%Y%m%d%H%M%S", errors="coerce")
+            hhmm = time_series.astype(str).str.zfill(6).str[:6].to_numpy(dtype=str)
+            fmt = "%Y%m%d%H%M%S"
         else:
-            parsed = pd.to_datetime(ts, format="%Y%m%d", errors="coerce")
-        parsed = parsed.dt.tz_localize("Asia/Seoul", nonexistent="shift_forward", ambiguous="NaT")
-
-        values = pd.to_numeric(value_series, errors="coerce")
-        frame = pd.DataFrame({"ts_kst": parsed, "value": values})
-        frame = frame.dropna(subset=["ts_kst", "value"]).drop_duplicates(subset=["ts_kst"])
-        frame = frame.sort_values("ts_kst").tail(periods)
-        frame["source"] = meta.get("source", "KIS")
-        frame["quality"] = meta.get("quality", "primary")
-        if meta.get("url"):
-            frame["url"] = meta["url"]
-        return frame.reset_index(drop=True)
-
-    def _series_meta(self, group: str, name: str) -> Dict[str, Any]:
-        section = self.series_meta.get(group, {})
-        return section.get(name, {})
+            hhmm = None
+            fmt = "%Y%m%d"
+
+        def parse(date_values: np.ndarray) -> pd.DatetimeIndex:
+            ts = np.char.add(date_values, hhmm) if hhmm is not None else date_values
+            # 형식을 고정해 한 번에 파싱하고, 시간대 지정은 Series 접근자 대신 DatetimeIndex에서 처리한다.
+            return pd.DatetimeIndex(pd.to_datetime(ts, format=fmt, errors="coerce", cache=True))
+
+        # KIS는 대부분 하이픈 없는 YYYYMMDD를 주므로 먼저 그대로 파싱하고,
+        # 실패한 값이 있을 때만 하이픈을 지운 문자열로 다시 파싱한다.
+        parsed = parse(dates)
+        if parsed.isna().any():
+            parsed = parse(np.char.replace(dates, "-", ""))
+        parsed = parsed.tz_localize("Asia/Seoul", nonexistent="shift_forward", ambiguous="NaT")
+
+        values = pd.to_numeric(value_series, errors="coerce").to_numpy()
+        # 결측 제거·중복 제거(첫 값 유지)·시간순 정렬·tail을 인덱스와 배열 위에서 처리하고 프레임은 마지막에 한 번만 만든다.
+        keep = ~(parsed.isna() | pd.isna(values))
+        parsed = parsed[keep]
+        values = values[keep]
+        unique = ~parsed.duplicated(keep="first")
+        parsed = parsed[unique]
+        values = values[unique]
+        order = np.argsort(parsed.asi8, kind="stable")[-periods:] if periods > 0 else np.empty(0, dtype=np.intp)
+        frame = pd.DataFrame({"ts_kst": parsed[order], "value": values[order]})
+        length = len(frame)
+        frame["source"] = _constant_column(plan.source, length)
+        frame["quality"] = _constant_column(plan.quality, length)
+        if plan.url:
+            frame["url"] = _constant_column(plan.url, length)
+        return frame
 
     def _fetch_series(self, group: str, name: str, periods: int = 120) -> pd.DataFrame:
-        meta = self._series_meta(group, name)
-        if not meta:
+        plan = self._plans.get((group, name))
+        if plan is None:
             raise KeyError(name)
-        path = meta.get("path")
-        if not path:
+        if not plan.path:
             raise ValueError(f"경로 누락: {group}/{name}")
-        tr_id = meta.get("tr_id", "")
-        params = meta.get("params", {}).copy()
-        if meta.get("period_param"):
-            params[meta["period_param"]] = str(periods)
-        payload = self._rest(meta.get("method", "GET"), path, params=params, json_body=meta.get("json"), tr_id=tr_id)
-        result_path = meta.get("result_path")
+        params = plan.params
+        if plan.period_param:
+            # 기간 파라미터가 있을 때만 복사본을 만들고, 없으면 미리 만든 dict를 그대로 넘긴다.
+            params = dict(params)
+            params[plan.period_param] = str(periods)
+        payload = self._rest(
+            plan.method,
+            plan.path,
+            params=params,
+            json_body=plan.json_body,
+            tr_id=plan.tr_id,
+            cache_ttl=plan.cache_ttl,
+            url=plan.endpoint,
+        )
+        result_path = plan.result_path
         items = payload.get(result_path) if result_path else None
         if items is None:
             for key in ("output2", "output1", "output"):
@@ -233,15 +421,21 @@ class KISClient:
                     break
         if items is None:
             raise ValueError(f"KIS 응답 파싱 실패: {payload}")
-        frame = self._normalize_timeseries(items, periods, meta)
-        if meta.get("unit"):
-            frame["unit"] = meta["unit"]
+        frame = self._normalize_timeseries(items, periods, plan)
+        if plan.unit:
+            frame["unit"] = plan.unit
         return frame
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _yf_history(self, symbol: str, periods: int = 120) -> pd.DataFrame:
+    def _yf_download(self, symbol: str) -> pd.DataFrame:
+        # 같은 실행에서 KIS가 계속 실패하면 같은 심볼을 여러 번 폴백 조회하므로, 원본 일봉을 KST 날짜별로 기억해 둔다.
+        # 반환값을 그대로 가공하지 않도록 _yf_history에서는 항상 새 프레임을 만든다.
+        key = (symbol, kst_now().date())
+        cached = self._yf_cache.get(key)
+        if cached is not None:
+            return cached
         data = yf.download(
             symbol,
             period="1y",
@@ -249,21 +443,24 @@ class KISClient:
             progress=False,
             auto_adjust=False,
             threads=False,
+            # 단일 심볼이라도 (Price, Ticker) 멀티 인덱스로 돌려주므로 처음부터 평평한 컬럼으로 받는다.
+            multi_level_index=False,
         )
+        if not data.empty:
+            self._yf_cache[key] = data
+        return data
+
+    def _yf_history(self, symbol: str, periods: int = 120) -> pd.DataFrame:
+        data = self._yf_download(symbol)
         if data.empty:
             raise ValueError(f"empty response for {symbol}")
 
+        # multi_level_index=False(yfinance>=1.0)로 받으므로 컬럼은 항상 평평하다.
         close = data
-        if isinstance(close.columns, pd.MultiIndex):
-            # Yahoo가 멀티 인덱스 컬럼으로 반환하는 경우 Close 레벨만 선택
-            level0 = close.columns.get_level_values(0)
-            if "Close" in level0:
-                close = close.xs("Close", axis=1, level=0)
-        if isinstance(close, pd.DataFrame):
-            if "Close" in close.columns:
-                close = close["Close"]
-            elif close.shape[1] == 1:
-                close = close.iloc[:, 0]
+        if "Close" in close.columns:
+            close = close["Close"]
+        elif close.shape[1] == 1:
+            close = close.iloc[:, 0]
         if not isinstance(close, pd.Series):
             raise ValueError(f"unable to locate close column for {symbol}")
 
@@ -272,115 +469,211 @@ class KISClient:
             raise ValueError(f"no close data for {symbol}")
 
         close = close.tail(periods)
-        idx = _to_kst_index(close.index)
         length = len(close)
-        data_dict = {
-            "ts_kst": list(idx),
-            "value": close.to_numpy().reshape(length),
-            "source": [f"YahooFinance({symbol})"] * length,
-            "quality": ["secondary"] * length,
-            "url": [f"https://finance.yahoo.com/quote/{symbol}"] * length,
-        }
-        frame = pd.DataFrame(data_dict)
-        return frame
+        # 인덱스와 값 배열을 그대로 넘기고, 상수 컬럼은 범주형으로 만들어 행마다 문자열을 두지 않는다.
+        return pd.DataFrame(
+            {
+                "ts_kst": _to_kst_index(close.index),
+                "value": close.to_numpy(),
+                "source": _constant_column(f"YahooFinance({symbol})", length),
+                "quality": _constant_column("secondary", length),
+                "url": _constant_column(f"https://finance.yahoo.com/quote/{symbol}", length),
+            }
+        )
 
     def _fallback_symbol(self, group: str, name: str) -> Optional[str]:
         section = self.fallback.get(group, {})
         return section.get(name)
 
-    def _pykrx_kor_yields(self, periods: int = 120) -> pd.DataFrame:
-        records: list[dict[str, Any]] = []
-        candidates = {
-            "kr3y": [
-                "국고채(3년)",
-                "3년",
-                "3년물",
-                "3Y",
-                "3-year",
-                "국채3년",
-            ],
-            "kr10y": [
-                "국고채(10년)",
-                "10년",
-                "10년물",
-                "10Y",
-                "10-year",
-                "국채10년",
-            ],
-        }
+    @staticmethod
+    def _pick_pykrx_yield(daily: pd.DataFrame, key: str) -> pd.Series:
+        for column in _PYKRX_YIELD_CANDIDATES[key]:
+            if column in daily.columns:
+                values = pd.to_numeric(daily[column], errors="coerce")
+                if values.notna().any():
+                    return values
+        return pd.Series(dtype=float)
 
-        def pick(series_df: pd.DataFrame, key: str) -> pd.Series:
-            for column in candidates[key]:
-                if column in series_df.columns:
-                    values = pd.to_numeric(series_df[column], errors="coerce")
-                    if values.notna().any():
-                        return values
-            return pd.Series(dtype=float)
+    def _pykrx_yield_pair(self, date_str: str) -> Optional[tuple[float, float]]:
+        """하루치 3년/10년 수익률을 조회한다. 값이 없거나 조회에 실패하면 ``None``이다.
 
-        today = datetime.now(KST).date()
-        for offset in range(periods * 3):
-            current = today - timedelta(days=offset)
-            date_str = current.strftime("%Y%m%d")
-            try:
-                daily = bond.get_otc_treasury_yields(date_str)
-            except Exception as exc:  # pragma: no cover - network dependent
-                logger.debug("pykrx 국채수익률 조회 실패(%s): %s", date_str, exc)
-                continue
+        pykrx는 네트워크·파싱 오류도 빈 DataFrame으로 돌려주므로 빈 응답과 실패를 구분할 수 없다.
+        """
 
-            if daily is None or daily.empty:
-                continue
+        try:
+            daily = bond.get_otc_treasury_yields(date_str)
+        except Exception as exc:  # pragma: no cover - network dependent
+            logger.debug("pykrx 국채수익률 조회 실패(%s): %s", date_str, exc)
+            return None
 
-            daily = daily.reset_index(drop=True)
-            three = pick(daily, "kr3y")
-            ten = pick(daily, "kr10y")
+        if daily is None or daily.empty:
+            return None
 
-            if three.empty or ten.empty:
-                continue
+        daily = daily.reset_index(drop=True)
+        three = self._pick_pykrx_yield(daily, "kr3y")
+        ten = self._pick_pykrx_yield(daily, "kr10y")
+        if three.empty or ten.empty:
+            return None
 
-            value3 = three.iloc[-1]
-            value10 = ten.iloc[-1]
-            if pd.isna(value3) or pd.isna(value10):
-                continue
+        value3 = three.iloc[-1]
+        value10 = ten.iloc[-1]
+        if pd.isna(value3) or pd.isna(value10):
+            return None
+        return float(value3), float(value10)
 
-            ts = datetime.combine(current, time(17, 0), tzinfo=KST)
-            records.append(
-                {
-                    "ts_kst": ts,
-                    "kr3y": float(value3),
-                    "kr10y": float(value10),
-                }
-            )
+    def _load_pykrx_yield_cache(self) -> Dict[str, list]:
+        try:
+            cached = _json_loads(self.pykrx_yield_cache.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cached, dict):
+            return {}
+        # 예전 형식에서 남은 null(조회 실패) 항목은 버리고 다시 조회한다.
+        return {key: pair for key, pair in cached.items() if isinstance(pair, list) and len(pair) == 2}
 
-            if len(records) >= periods:
+    def _pykrx_kor_yields(self, periods: int = 120) -> pd.DataFrame:
+        # 행마다 dict를 만들지 않도록 최대 periods개짜리 배열을 미리 잡아 두고 앞에서부터 채운다.
+        found_days: list[Any] = []
+        kr3y = np.empty(periods, dtype=np.float64)
+        kr10y = np.empty(periods, dtype=np.float64)
+        today = datetime.now(KST).date()
+        # 주말에는 장외 국고채 고시가 없으므로 조회 대상에서 뺀다.
+        dates = [
+            current
+            for current in (today - timedelta(days=offset) for offset in range(periods * 3))
+            if current.weekday() < 5
+        ]
+        # 지난 날짜의 고시 수익률은 바뀌지 않으므로 디스크에 남겨 두고, 오늘 값만 매번 새로 조회한다.
+        # 값을 받은 날짜만 저장하므로 빈 응답(휴일·오류)은 다음 실행에서 다시 조회한다.
+        # 조회 범위를 벗어난 오래된 날짜는 캐시에서 지운다.
+        window = {current.strftime("%Y%m%d") for current in dates}
+        loaded = self._load_pykrx_yield_cache()
+        cache = {key: pair for key, pair in loaded.items() if key in window}
+        dirty = len(cache) != len(loaded)
+        batch = self.max_workers * 2
+        for start in range(0, len(dates), batch):
+            chunk = dates[start : start + batch]
+            keys = [current.strftime("%Y%m%d") for current in chunk]
+            fetched = self._run_parallel(
+                {key: (lambda key=key: self._pykrx_yield_pair(key)) for key in keys if key not in cache},
+                needs_token=False,
+            )
+            pairs: Dict[str, Any] = {}
+            for current, key in zip(chunk, keys):
+                if key in cache:
+                    pairs[key] = cache[key]
+                    continue
+                pair = fetched[key]
+                pairs[key] = pair
+                if pair is not None and current < today:
+                    cache[key] = list(pair)
+                    dirty = True
+            for current, key in zip(chunk, keys):
+                pair = pairs[key]
+                if pair is None:
+                    continue
+                kr3y[len(found_days)] = pair[0]
+                kr10y[len(found_days)] = pair[1]
+                found_days.append(current)
+                if len(found_days) >= periods:
+                    break
+            if len(found_days) >= periods:
                 break
 
-        frame = pd.DataFrame(records)
-        if frame.empty:
+        if dirty:
+            try:
+                _write_bytes_atomic(self.pykrx_yield_cache, _json_dumps(cache))
+            except OSError as exc:  # pragma: no cover - 파일 시스템 상태에 따라 달라짐
+                logger.debug("pykrx 국채수익률 캐시 저장 실패: %s", exc)
+
+        if not found_days:
             return pd.DataFrame(
                 columns=["ts_kst", "kr3y", "kr10y", "source", "quality", "url"]
             )
 
-        frame = frame.drop_duplicates(subset=["ts_kst"]).sort_values("ts_kst").tail(periods)
-        frame["source"] = "pykrx"
-        frame["quality"] = "secondary"
-        frame["url"] = "https://www.kofiabond.or.kr"
-        return frame.reset_index(drop=True)
+        # 날짜는 최신순으로 하나씩만 들어오므로 뒤집기만 하면 시간순이 된다.
+        count = len(found_days)
+        ts_index = pd.DatetimeIndex([datetime.combine(day, time(17, 0), tzinfo=KST) for day in reversed(found_days)])
+        return pd.DataFrame(
+            {
+                "ts_kst": ts_index,
+                "kr3y": kr3y[:count][::-1],
+                "kr10y": kr10y[:count][::-1],
+                "source": _constant_column("pykrx", count),
+                "quality": _constant_column("secondary", count),
+                "url": _constant_column("https://www.kofiabond.or.kr", count),
+            }
+        )
+
+    def _load_yield_cache(self, key: str, periods: int) -> tuple[Optional[pd.DataFrame], int]:
+        """디스크에 저장된 어제까지의 수익률 행과, 이어서 새로 받아야 할 기간 수를 돌려준다."""
+
+        try:
+            cached = pd.read_parquet(self.yield_cache_dir / f"{key}.parquet")
+        except (OSError, ValueError, ImportError):
+            return None, periods
+        if cached.empty or not {"ts_kst", "value"}.issubset(cached.columns):
+            return None, periods
+        cached["ts_kst"] = _to_kst_index(pd.DatetimeIndex(cached["ts_kst"]))
+        today = kst_now().date()
+        # 오늘 값은 장중에 바뀔 수 있으므로 캐시에서 빼고 항상 새로 받는다.
+        past = cached[cached["ts_kst"] < pd.Timestamp(today).tz_localize(KST)]
+        if past.empty:
+            return None, periods
+        count = min(periods, (today - past["ts_kst"].iloc[-1].date()).days + 1)
+        if len(past) + count < periods:
+            return None, periods
+        return past.reset_index(drop=True), count
+
+    def _store_yield_cache(
+        self, key: str, cached: Optional[pd.DataFrame], fresh: pd.DataFrame, periods: int
+    ) -> pd.DataFrame:
+        """새로 받은 행을 캐시된 과거 행 뒤에 붙이고, 결과를 다시 디스크에 써 둔다."""
+
+        frame = fresh
+        if cached is not None:
+            frame = pd.concat([cached, fresh], ignore_index=True)
+            frame = frame.drop_duplicates(subset=["ts_kst"], keep="last").sort_values("ts_kst", kind="stable")
+            frame = frame.tail(periods).reset_index(drop=True)
+        try:
+            _write_bytes_atomic(self.yield_cache_dir / f"{key}.parquet", frame.to_parquet(index=False, compression="zstd"))
+        except (OSError, ValueError, ImportError) as exc:  # pragma: no cover - 파일 시스템/엔진 상태에 따라 달라짐
+            logger.debug("%s 수익률 캐시 저장 실패: %s", key, exc)
+        return frame
 
     def _fetch_yield_with_retry(self, alias: str, periods: int = 120) -> pd.DataFrame:
+        key = f"kis_{alias.lower()}"
+        cached, count = self._load_yield_cache(key, periods)
         last_exc: Optional[Exception] = None
         for attempt in range(3):
             try:
-                frame = self._fetch_series("yields", alias, periods)
+                frame = self._fetch_series("yields", alias, count)
                 if frame.empty:
                     raise ValueError("empty response")
-                return frame
-            except Exception as exc:
+                return self._store_yield_cache(key, cached, frame, periods)
+            except _FETCH_ERRORS as exc:
                 last_exc = exc
                 logger.debug("KIS %s 수익률 %d차 시도 실패: %s", alias, attempt + 1, exc)
         if last_exc:
             raise last_exc
         raise RuntimeError(f"{alias} fetch failed")
 
+    def _fetch_yield_with_retry_safe(self, alias: str) -> tuple[Optional[pd.DataFrame], Optional[Exception]]:
+        # 스레드 풀에서 한쪽 실패가 다른 쪽 결과를 가리지 않도록 예외를 값으로 돌려준다.
+        try:
+            return self._fetch_yield_with_retry(alias), None
+        except _FETCH_ERRORS as exc:
+            return None, exc
+
+    def _ecos_get(self, url: str, timeout: float) -> tuple[Optional[Any], Optional[Exception]]:
+        # 스레드 풀에서 한 계열의 실패가 다른 계열 결과를 가리지 않도록 예외를 값으로 돌려준다.
+        try:
+            resp = self.session.get(url, timeout=timeout)
+            resp.raise_for_status()
+            return _json_loads(resp.content), None
+        except Exception as exc:
+            return None, exc
+
     def _ecos_kor_yields(self, targets: Iterable[str], periods: int = 120) -> tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
         ecos_cfg = self.config.get("ecos", {})
         if not ecos_cfg:
@@ -396,13 +689,15 @@ class KISClient:
         base_url = ecos_cfg.get("base_url", "https://ecos.bok.or.kr/api/StatisticSearch")
         timeout = ecos_cfg.get("timeout", 25)
         end = kst_now().date()
-        start = end - timedelta(days=periods * 3)
-        start_str = start.strftime("%Y%m%d")
         end_str = end.strftime("%Y%m%d")
+        # 키와 언어까지의 앞부분은 모든 계열에서 같으므로 한 번만 만든다.
+        prefix = f"{base_url.rstrip('/')}/{api_key}/json/kr"
 
         results: Dict[str, pd.DataFrame] = {}
         failures: Dict[str, str] = {}
         series_meta = ecos_cfg.get("series", {})
+        pending: Dict[str, tuple[Dict[str, Any], str, Optional[pd.DataFrame], int]] = {}
+        calls: Dict[str, Callable[[], tuple[Optional[Any], Optional[Exception]]]] = {}
 
         for alias in targets:
             meta = series_meta.get(alias)
@@ -414,31 +709,21 @@ class KISClient:
                 failures[alias] = "ecos_statistic_missing"
                 continue
             cycle = meta.get("cycle", "DD")
-            items = list(meta.get("items", []))
-            while len(items) < 3:
-                items.append("")
+            item1, item2, item3 = ([item or "" for item in meta.get("items", [])[:3]] + ["", "", ""])[:3]
+            key = f"ecos_{alias.lower()}"
+            cached, count = self._load_yield_cache(key, periods)
+            start_str = (end - timedelta(days=count * 3)).strftime("%Y%m%d")
             start_row = int(meta.get("start_row", 1))
             end_row = int(meta.get("end_row", max(200, periods * 3)))
-            url = "/".join(
-                [
-                    base_url.rstrip("/"),
-                    api_key,
-                    "json",
-                    "kr",
-                    str(start_row),
-                    str(end_row),
-                    statistic,
-                    cycle,
-                    start_str,
-                    end_str,
-                    *(item or "" for item in items[:3]),
-                ]
-            )
-            try:
-                resp = self.session.get(url, timeout=timeout)
-                resp.raise_for_status()
-                payload = resp.json()
-            except Exception as exc:
+            url = f"{prefix}/{start_row}/{end_row}/{statistic}/{cycle}/{start_str}/{end_str}/{item1}/{item2}/{item3}"
+            pending[alias] = (meta, key, cached, count)
+            calls[alias] = lambda url=url: self._ecos_get(url, timeout)
+
+        # 계열별 ECOS 요청은 서로 독립적이므로 동시에 보내고, 응답은 요청 순서대로 처리한다.
+        responses = self._run_parallel(calls, needs_token=False)
+        for alias, (meta, key, cached, count) in pending.items():
+            payload, exc = responses[alias]
+            if exc is not None:
                 logger.warning("ECOS %s 요청 실패: %s", alias, exc)
                 failures[alias] = "ecos_request_failed"
                 continue
@@ -456,19 +741,40 @@ class KISClient:
             frame["ts_kst"] = pd.to_datetime(frame["TIME"], format="%Y%m%d", errors="coerce")
             frame["ts_kst"] = frame["ts_kst"].dt.tz_localize(KST, nonexistent="shift_forward", ambiguous="NaT")
             frame["value"] = pd.to_numeric(frame["DATA_VALUE"], errors="coerce")
-            frame = frame.dropna(subset=["ts_kst", "value"]).sort_values("ts_kst").tail(periods)
+            frame = frame.dropna(subset=["ts_kst", "value"]).drop_duplicates(subset=["ts_kst"])
+            frame = frame.sort_values("ts_kst").tail(count)
             if frame.empty:
                 failures[alias] = "ecos_empty"
                 continue
 
-            frame = frame[["ts_kst", "value"]]
-            frame["source"] = "BOK_ECOS"
-            frame["quality"] = "secondary"
-            frame["url"] = meta.get("url", base_url)
-            results[alias] = frame.reset_index(drop=True)
+            frame = frame[["ts_kst", "value"]].reset_index(drop=True)
+            length = len(frame)
+            frame["source"] = _constant_column("BOK_ECOS", length)
+            frame["quality"] = _constant_column("secondary", length)
+            frame["url"] = _constant_column(meta.get("url", base_url), length)
+            results[alias] = self._store_yield_cache(key, cached, frame, periods)
 
         return results, failures
 
+    def _run_parallel(self, calls: Dict[str, Callable[[], Any]], *, needs_token: bool = True) -> Dict[str, Any]:
+        """서로 독립적인 HTTP 조회를 스레드 풀에서 동시에 실행한다.
+
+        결과는 ``calls``의 키 순서대로 돌려주며, 각 호출의 예외는 ``result()``에서 그대로 다시 발생한다.
+        """
+
+        if len(calls) <= 1 or self.max_workers <= 1:
+            return {key: call() for key, call in calls.items()}
+        if needs_token and self.use_live:
+            # 스레드마다 동시에 토큰을 새로 발급받지 않도록 먼저 한 번 받아 둔다.
+            # 여기서 실패하면 각 호출이 평소처럼 재시도하고 실패를 기록한다.
+            try:
+                self.get_token()
+            except Exception as exc:
+                logger.debug("KIS 토큰 선발급 실패: %s", exc)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as pool:
+            futures = {key: pool.submit(call) for key, call in calls.items()}
+            return {key: future.result() for key, future in futures.items()}
+
     # ------------------------------------------------------------------
     # Data accessors
     # ------------------------------------------------------------------
@@ -477,7 +783,7 @@ class KISClient:
             try:
                 frame = self._fetch_series("indexes", name, periods)
                 return frame
-            except Exception as exc:
+            except _FETCH_ERRORS as exc:
                 logger.warning("KIS 지수 조회 실패(%s): %s", name, exc)
         symbol = self._fallback_symbol("indexes", name)
         if symbol:
@@ -492,7 +798,7 @@ class KISClient:
             try:
                 frame = self._fetch_series("fx", name, periods)
                 return frame
-            except Exception as exc:
+            except _FETCH_ERRORS as exc:
                 logger.warning("KIS 환율 조회 실패(%s): %s", name, exc)
         symbol = self._fallback_symbol("fx", name)
         if symbol:
@@ -507,7 +813,7 @@ class KISClient:
             try:
                 frame = self._fetch_series("futures", name, periods)
                 return frame
-            except Exception as exc:
+            except _FETCH_ERRORS as exc:
                 logger.warning("KIS 선물 조회 실패(%s): %s", name, exc)
         lookup_key = alias or name
         symbol = self._fallback_symbol("futures", lookup_key)
@@ -518,13 +824,45 @@ class KISClient:
                 logger.warning("futures fallback failed for %s (%s): %s", lookup_key, symbol, exc)
         return pd.DataFrame()
 
+    def get_series_batch(
+        self,
+        specs: Iterable[Tuple[str, str, Optional[str]]],
+        periods: int = 120,
+    ) -> Dict[str, pd.DataFrame]:
+        """``(group, name, alias)`` 목록을 동시에 조회해 ``alias or name`` 키로 돌려준다.
+
+        group은 ``indexes``/``fx``/``futures`` 중 하나이며, 각 getter의 폴백·예외 처리는 그대로 따른다.
+        """
+
+        getters = {
+            "indexes": lambda name, alias: self.get_index_series(name, periods),
+            "fx": lambda name, alias: self.get_fx_series(name, periods),
+            "futures": lambda name, alias: self.get_futures_series(name, periods, alias=alias),
+        }
+        calls: Dict[str, Callable[[], pd.DataFrame]] = {}
+        for group, name, alias in specs:
+            getter = getters[group]
+            calls[alias or name] = lambda getter=getter, name=name, alias=alias: getter(name, alias)
+        return self._run_parallel(calls)
+
     def _pykrx_snapshots(self) -> pd.DataFrame:
         today = kst_now()
+        kospi = kosdaq = pd.DataFrame()
         for offset in range(10):
             target = today - timedelta(days=offset)
+            if target.weekday() >= 5:
+                # 주말에는 KRX 시세가 없으므로 조회하지 않고 건너뛴다.
+                continue
             date_str = target.strftime("%Y%m%d")
-            kospi = stock.get_market_ohlcv_by_ticker(date_str, market="KOSPI")
-            kosdaq = stock.get_market_ohlcv_by_ticker(date_str, market="KOSDAQ")
+            # 두 시장 조회는 서로 독립적이므로 동시에 보낸다.
+            result = self._run_parallel(
+                {
+                    market: (lambda market=market: stock.get_market_ohlcv_by_ticker(date_str, market=market))
+                    for market in ("KOSPI", "KOSDAQ")
+                },
+                needs_token=False,
+            )
+            kospi, kosdaq = result["KOSPI"], result["KOSDAQ"]
             if not kospi.empty or not kosdaq.empty:
                 break
         frames = []
@@ -532,18 +870,16 @@ class KISClient:
             if df.empty:
                 continue
             temp = df.reset_index().rename(columns={"티커": "code"})
-            temp["market"] = market_label
-            close = pd.to_numeric(temp.get("종가"), errors="coerce")
-            pct = pd.to_numeric(temp.get("등락률"), errors="coerce") / 100.0
-            denom = 1 + pct
-            denom = denom.replace({0: pd.NA})
-            prev_close = close / denom
-            prev_close = prev_close.fillna(close)
+            # 종목 수천 개에 대해 중간 Series를 만들지 않도록 숫자 컬럼을 한 번씩만 배열로 꺼내 계산한다.
+            close = pd.to_numeric(temp.get("종가"), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            pct = pd.to_numeric(temp.get("등락률"), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan) / 100.0
+            denom = 1.0 + pct
+            with np.errstate(divide="ignore", invalid="ignore"):
+                prev_close = close / np.where(denom == 0, np.nan, denom)
+            prev_close = np.where(np.isnan(prev_close), close, prev_close)
             change = close - prev_close
-            value_traded = pd.to_numeric(temp.get("거래대금"), errors="coerce") / 1e9
-            limit_flag = pd.Series("neutral", index=temp.index)
-            limit_flag.loc[pct >= 0.295] = "upper"
-            limit_flag.loc[pct <= -0.295] = "lower"
+            value_traded = pd.to_numeric(temp.get("거래대금"), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan) / 1e9
+            limit_flag = np.select([pct >= 0.295, pct <= -0.295], ["upper", "lower"], default="neutral").astype(object)
             frames.append(
                 pd.DataFrame(
                     {
@@ -552,7 +888,7 @@ class KISClient:
                         "close": close,
                         "prev_close": prev_close,
                         "change": change,
-                        "value_traded": value_traded.fillna(0),
+                        "value_traded": np.where(np.isnan(value_traded), 0.0, value_traded),
                         "limit_flag": limit_flag,
                     }
                 )
@@ -576,24 +912,30 @@ class KISClient:
         self.yield_failure_meta = {}
 
         frames: Dict[str, pd.DataFrame] = {}
-        used_sources: list[str] = []
-        used_urls: list[str] = []
+        # 순서를 지키는 중복 제거용으로 dict를 집합처럼 쓴다.
+        used_sources: Dict[str, None] = {}
+        used_urls: Dict[str, None] = {}
         missing: set[str] = {"KR3Y", "KR10Y"}
 
         if self.use_live:
-            for alias in list(missing):
+            aliases = sorted(missing)
+            # 3년물과 10년물 조회는 서로 독립적이므로 동시에 보내고, 결과는 정해진 순서로 반영한다.
+            calls = {alias: (lambda alias=alias: self._fetch_yield_with_retry_safe(alias)) for alias in aliases}
+            outcomes = self._run_parallel(calls)
+            for alias in aliases:
                 try:
-                    frame = self._fetch_yield_with_retry(alias)
+                    frame, exc = outcomes[alias]
+                    if exc is not None:
+                        raise exc
                     frames[alias.lower()] = frame
                     missing.discard(alias)
                     src = "KIS"
                     url = self.series_meta.get("yields", {}).get(alias, {}).get("url", self.base_url)
-                    if src not in used_sources:
-                        used_sources.append(src)
-                    if url and url not in used_urls:
-                        used_urls.append(url)
+                    used_sources.setdefault(src, None)
+                    if url:
+                        used_urls.setdefault(url, None)
                     self.yield_failure_meta.pop(alias, None)
-                except Exception as exc:
+                except _FETCH_ERRORS as exc:
                     logger.warning("KIS 국채수익률 %s 조회 실패: %s", alias, exc)
                     meta = self.series_meta.get("yields", {}).get(alias, {})
                     url = meta.get("url", self.base_url)
@@ -608,10 +950,10 @@ class KISClient:
                 missing.discard(alias)
                 src = str(frame.get("source", pd.Series(["BOK_ECOS"])).iloc[-1]) if not frame.empty else "BOK_ECOS"
                 url = str(frame.get("url", pd.Series([""])).iloc[-1]) if not frame.empty else ""
-                if src and src not in used_sources:
-                    used_sources.append(src)
-                if url and url not in used_urls:
-                    used_urls.append(url)
+                if src:
+                    used_sources.setdefault(src, None)
+                if url:
+                    used_urls.setdefault(url, None)
                 self.yield_failure_meta.pop(alias, None)
             for alias, reason in ecos_failures.items():
                 if alias in missing:
@@ -633,11 +975,10 @@ class KISClient:
                         temp["url"] = pykrx_frame.get("url", pd.Series(["https://www.kofiabond.or.kr"]))
                         frames[alias.lower()] = temp
                         missing.discard(alias)
-                        if "pykrx" not in used_sources:
-                            used_sources.append("pykrx")
+                        used_sources.setdefault("pykrx", None)
                         url = str(temp.get("url", pd.Series([""])).iloc[-1]) if not temp.empty else ""
-                        if url and url not in used_urls:
-                            used_urls.append(url)
+                        if url:
+                            used_urls.setdefault(url, None)
                         self.yield_failure_meta.pop(alias, None)
 
         if missing:
@@ -655,12 +996,12 @@ class KISClient:
             return pd.DataFrame()
 
         if not used_sources:
-            used_sources.append("secondary")
-        merged["source"] = "+".join(dict.fromkeys(used_sources))
+            used_sources["secondary"] = None
+        merged["source"] = "+".join(used_sources)
         qualities = []
         for df in frames.values():
             if "quality" in df.columns and not df.empty:
                 qualities.append(str(df["quality"].iloc[-1]))
         merged["quality"] = "primary" if "KIS" in used_sources else ("secondary" if qualities else "secondary")
-        merged["url"] = " ".join(dict.fromkeys([u for u in used_urls if u]))
+        merged["url"] = " ".join(used_urls)
         return merged
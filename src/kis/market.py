@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Iterable, Optional, Tuple
 
 import pandas as pd
 
@@ -61,6 +61,24 @@ def futures_series(client: KISClient, name: str, periods: int = 120, alias: str
     return _inject_defaults(frame, client, unit, "close", alias or name)
 
 
+def series_batch(
+    client: KISClient,
+    specs: Iterable[Tuple[str, str, Optional[str], str, str]],
+    periods: int = 120,
+) -> Dict[str, pd.DataFrame]:
+    """``(group, name, alias, asset, unit)`` 목록을 한꺼번에 조회해 ``asset`` 키로 돌려준다.
+
+    개별 ``index_series``/``fx_series``/``futures_series``와 같은 기본값을 채우되, 조회는 동시에 진행한다.
+    """
+
+    spec_list = list(specs)
+    frames = client.get_series_batch([(group, name, alias) for group, name, alias, _, _ in spec_list], periods)
+    return {
+        asset: _inject_defaults(frames[alias or name], client, unit, "close", asset)
+        for _, name, alias, asset, unit in spec_list
+    }
+
+
 def equity_snapshots(client: KISClient, universe: pd.DataFrame) -> pd.DataFrame:
     snap = client.get_equity_universe(universe)
     return snap
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
@@ -149,61 +150,69 @@ def _from_html(asset: str, url: str, selectors: Tuple[str, ...]) -> pd.DataFrame
     return frame
 
 
-def fetch(periods: int = 120) -> Dict[str, FetchResult]:
-    results: Dict[str, FetchResult] = {}
-    for asset, symbol in SYMBOL_MAP.items():
-        frames: list[pd.DataFrame] = []
-        note = ""
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", category=FutureWarning)
-                data = yf.download(
-                    symbol,
-                    period="6mo",
-                    interval="1d",
-                    progress=False,
-                    auto_adjust=False,
-                    threads=False,
-                )
-            series = _extract_close(data).tail(periods)
-            idx = pd.DatetimeIndex(series.index)
-            if idx.tz is None:
-                idx = idx.tz_localize("UTC")
-            idx = idx.tz_convert("Asia/Seoul")
-            length = len(series)
-            frames.append(
-                pd.DataFrame(
-                    {
-                        "ts_kst": idx,
-                        "asset": [asset] * length,
-                        "field": ["close"] * length,
-                        "value": series.to_numpy(),
-                        "unit": ["usd"] * length,
-                        "source": ["finance.yahoo.com"] * length,
-                        "quality": ["secondary"] * length,
-                        "url": [f"https://finance.yahoo.com/quote/{symbol}"] * length,
-                    }
-                )
+def _fetch_asset(asset: str, symbol: str, periods: int) -> FetchResult:
+    frames: list[pd.DataFrame] = []
+    note = ""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=FutureWarning)
+            data = yf.download(
+                symbol,
+                period="6mo",
+                interval="1d",
+                progress=False,
+                auto_adjust=False,
+                threads=False,
             )
-        except Exception as exc:  # pragma: no cover - network dependent
-            note = f"parse_failed:https://finance.yahoo.com/quote/{symbol},{exc}"
-            logger.warning("yfinance download failed for %s: %s", asset, exc)
-
-        if not frames:
-            for url, selectors in HTML_SOURCES.get(asset, []):
-                try:
-                    frame = _from_html(asset, url, tuple(selectors))
-                    frames.append(frame)
-                    note = ""
-                    break
-                except Exception as exc:  # pragma: no cover - network dependent
-                    note = f"parse_failed:{url},{exc}"
-                    logger.warning("HTML parse failed for %s (%s): %s", asset, url, exc)
-                    continue
-
-        if frames:
-            frame = pd.concat(frames, ignore_index=True)
-        else:
-            frame = pd.DataFrame(columns=["ts_kst", "asset", "field", "value", "unit", "source", "quality", "url"])
-        results[asset] = FetchResult(frame=frame, note=note)
-    return results
+        series = _extract_close(data).tail(periods)
+        idx = pd.DatetimeIndex(series.index)
+        if idx.tz is None:
+            idx = idx.tz_localize("UTC")
+        idx = idx.tz_convert("Asia/Seoul")
+        length = len(series)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "ts_kst": idx,
+                    "asset": [asset] * length,
+                    "field": ["close"] * length,
+                    "value": series.to_numpy(),
+                    "unit": ["usd"] * length,
+                    "source": ["finance.yahoo.com"] * length,
+                    "quality": ["secondary"] * length,
+                    "url": [f"https://finance.yahoo.com/quote/{symbol}"] * length,
+                }
+            )
+        )
+    except Exception as exc:  # pragma: no cover - network dependent
+        note = f"parse_failed:https://finance.yahoo.com/quote/{symbol},{exc}"
+        logger.warning("yfinance download failed for %s: %s", asset, exc)
+
+    if not frames:
+        for url, selectors in HTML_SOURCES.get(asset, []):
+            try:
+                frame = _from_html(asset, url, tuple(selectors))
+                frames.append(frame)
+                note = ""
+                break
+            except Exception as exc:  # pragma: no cover - network dependent
+                note = f"parse_failed:{url},{exc}"
+                logger.warning("HTML parse failed for %s (%s): %s", asset, url, exc)
+                continue
+
+    if frames:
+        frame = pd.concat(frames, ignore_index=True)
+    else:
+        frame = pd.DataFrame(columns=["ts_kst", "asset", "field", "value", "unit", "source", "quality", "url"])
+    return FetchResult(frame=frame, note=note)
+
+
+def fetch(periods: int = 120, max_workers: int = 4) -> Dict[str, FetchResult]:
+    # 자산별 조회(yfinance → HTML 대체)는 서로 독립적인 네트워크 대기이므로 KISClient와 같은
+    # max_workers 한도 안에서 동시에 보내고, 결과는 SYMBOL_MAP 순서대로 모은다.
+    workers = min(max(1, max_workers), len(SYMBOL_MAP))
+    if workers <= 1:
+        return {asset: _fetch_asset(asset, symbol, periods) for asset, symbol in SYMBOL_MAP.items()}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {asset: pool.submit(_fetch_asset, asset, symbol, periods) for asset, symbol in SYMBOL_MAP.items()}
+        return {asset: future.result() for asset, future in futures.items()}
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 import pandas as pd
 
-from .utils import ensure_dir, iso_ts
+from .utils import ensure_dir, iso_ts, parse_timestamp, to_kst, write_json
 
 RAW_DIR = Path("raw")
 OUT_DIR = Path("out")
 DAILY_DIR = OUT_DIR / "daily"
 LOG_DIR = OUT_DIR / "logs"
 DEBUG_DIR = OUT_DIR / "debug"
+RUN_CACHE_DIR = Path("cache") / "last_run"
 
 
 def write_raw(asset: str, phase: str, frame: pd.DataFrame) -> Path:
@@ -89,3 +90,40 @@ def write_debug(name: str, html: str) -> Path:
     with path.open("w", encoding="utf-8") as fh:
         fh.write(html)
     return path
+
+
+def _run_snapshot_path(phase: str, variant: str) -> Path:
+    # 같은 phase라도 실행 옵션(예: --reconcile)이 다르면 결과가 다르므로 파일을 나눈다.
+    name = f"{phase}_{variant}" if variant else phase
+    return RUN_CACHE_DIR / f"{name}.json"
+
+
+def write_run_snapshot(phase: str, ts: datetime, rows: Iterable[Dict], variant: str = "") -> Path:
+    """성공한 실행의 최종 레코드를 phase·실행 옵션별로 보관한다."""
+
+    path = _run_snapshot_path(phase, variant)
+    write_json(path, {"phase": phase, "variant": variant, "ts": iso_ts(ts), "records": list(rows)})
+    return path
+
+
+def load_run_snapshot(phase: str, now: datetime, max_age: timedelta, variant: str = "") -> Optional[List[Dict]]:
+    """같은 날 max_age 안에 같은 옵션으로 성공한 실행이 있으면 그 레코드를 돌려준다."""
+
+    path = _run_snapshot_path(phase, variant)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    try:
+        saved_at = parse_timestamp(payload["ts"])
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return None
+    now_kst = to_kst(now)
+    if saved_at.date() != now_kst.date() or now_kst - saved_at > max_age:
+        return None
+    records = payload.get("records")
+    if not isinstance(records, list) or not all(isinstance(row, dict) for row in records):
+        return None
+    return records
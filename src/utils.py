@@ -5,7 +5,7 @@ import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -88,13 +88,17 @@ def calc_simple_returns(series: pd.Series) -> pd.Series:
     return series.pct_change()
 
 
-def rolling_vol(series: pd.Series, window: int) -> float:
-    if len(series) < window:
+def rolling_vol(series: pd.Series | np.ndarray, window: int) -> float:
+    # Series뿐 아니라 compute의 float64 배열도 그대로 받아 pandas 연산 없이 계산한다.
+    prices = np.asarray(series, dtype=np.float64)
+    if prices.size < window:
         return float("nan")
-    returns = calc_log_returns(series).dropna()
-    if returns.empty:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.log(prices[1:] / prices[:-1])
+    returns = returns[~np.isnan(returns)][-window:]
+    if returns.size < 2:
         return float("nan")
-    return float(np.sqrt(252) * returns.tail(window).std())
+    return float(np.sqrt(252) * returns.std(ddof=1))
 
 
 def rolling_corr(series_a: pd.Series, series_b: pd.Series, window: int) -> float:
@@ -123,9 +127,37 @@ def load_yaml(path: Path) -> Dict[str, Any]:
 
 
 def clip_numeric(value: Any, precision: int = 6) -> Optional[float]:
-    if value is None or (isinstance(value, float) and math.isnan(value)):
+    if value is None:
         return None
-    return float(round(float(value), precision))
+    number = float(value)
+    # NaN·inf는 CSV/JSON에 그대로 쓸 수 없으므로 결측으로 본다.
+    if not math.isfinite(number):
+        return None
+    return float(round(number, precision))
+
+
+def clip_numeric_array(values: Sequence[Any], precision: int = 6) -> List[Optional[float]]:
+    """``clip_numeric``을 한 열 전체에 배열 연산으로 적용한다.
+
+    ``np.rint(x * 10**precision) / 10**precision``은 곱셈 오차 때문에 반올림 경계(.5) 바로
+    옆의 값이나 ``x * 10**precision``이 2**52 이상인 큰 값에서 내장 ``round``와 마지막 자리가
+    달라질 수 있다. 그런 원소만 골라 내장 ``round``로 다시 계산하므로 결과는 ``clip_numeric``과 같다.
+    """
+
+    array = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(array)
+    scale = 10.0**precision
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = array * scale
+        rounded = np.rint(scaled) / scale
+        distance = np.abs(scaled - np.floor(scaled) - 0.5)
+        exact = finite & (np.abs(scaled) < 2.0**52) & (distance > 4 * np.spacing(np.abs(scaled)))
+    for index in np.flatnonzero(finite & ~exact):
+        rounded[index] = round(float(array[index]), precision)
+    result = rounded.tolist()
+    for index in np.flatnonzero(~finite):
+        result[index] = None
+    return result
 
 
 def flatten_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -133,15 +165,30 @@ def flatten_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 def ensure_schema(row: Dict[str, Any]) -> Dict[str, Any]:
-    missing = [col for col in SCHEMA_COLUMNS if col not in row]
-    if missing:
-        raise ValueError(f"missing columns: {missing}")
-    quality = str(row.get("quality", "")).lower()
-    if quality not in ALLOWED_QUALITIES:
-        raise ValueError(f"invalid quality: {row.get('quality')}")
+    ensure_schema_batch([row])
     return row
 
 
+def ensure_schema_batch(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """레코드 묶음을 한 번에 검사한다.
+
+    같은 방식으로 만든 레코드는 키 구성과 quality 값이 몇 가지뿐이므로, 고유한 키 묶음과
+    quality 값만 모아 스키마와 비교한다.
+    """
+
+    batch = list(rows)
+    key_sets = {tuple(row) for row in batch}
+    for keys in key_sets:
+        missing = [col for col in SCHEMA_COLUMNS if col not in keys]
+        if missing:
+            raise ValueError(f"missing columns: {missing}")
+    qualities = {row.get("quality", "") for row in batch}
+    for quality in qualities:
+        if str(quality).lower() not in ALLOWED_QUALITIES:
+            raise ValueError(f"invalid quality: {quality}")
+    return batch
+
+
 def count_non_null(records: Iterable[Dict[str, Any]], required_keys: Iterable[str]) -> float:
     rows = list(records)
     required = set(required_keys)
@@ -0,0 +1,41 @@
+import math
+
+import pandas as pd
+import pytest
+
+from src.kis import breadth
+
+
+def test_adv_dec_unch_counts_per_market():
+    snapshots = pd.DataFrame(
+        {
+            "market": ["KOSPI", "KOSPI", "KOSPI", "KOSDAQ", "KOSDAQ"],
+            "change": [1.5, -0.5, 0.0, 2.0, None],
+            "value_traded": [100.0, 40.0, 10.0, 70.0, 5.0],
+            "limit_flag": ["upper", "", "", "", "lower"],
+        }
+    )
+    result = breadth.adv_dec_unch(snapshots)
+
+    assert list(result["adv_count"].index) == ["KOSDAQ", "KOSPI"]
+    assert result["adv_count"].to_dict() == {"KOSDAQ": 1, "KOSPI": 1}
+    assert result["dec_count"].to_dict() == {"KOSDAQ": 0, "KOSPI": 1}
+    assert result["unch_count"].to_dict() == {"KOSDAQ": 0, "KOSPI": 1}
+    assert result["adv_value"].to_dict() == {"KOSDAQ": 70.0, "KOSPI": 100.0}
+    assert result["dec_value"].to_dict() == {"KOSDAQ": 0.0, "KOSPI": 40.0}
+    assert result["limit_up"].to_dict() == {"KOSDAQ": 0, "KOSPI": 1}
+    assert result["limit_down"].to_dict() == {"KOSDAQ": 1, "KOSPI": 0}
+
+
+def test_trin_accepts_scalars_and_series():
+    assert breadth.trin(10, 5, 100, 50) == pytest.approx(1.0)
+    assert math.isnan(breadth.trin(10, 0, 100, 50))
+
+    result = breadth.trin(
+        pd.Series([10, 3], index=["KOSDAQ", "KOSPI"]),
+        pd.Series([5, 0], index=["KOSDAQ", "KOSPI"]),
+        pd.Series([100.0, 1.0], index=["KOSDAQ", "KOSPI"]),
+        pd.Series([25.0, 1.0], index=["KOSDAQ", "KOSPI"]),
+    )
+    assert result["KOSDAQ"] == pytest.approx(0.5)
+    assert math.isnan(result["KOSPI"])
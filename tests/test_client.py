@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.kis import client as client_module
+from src.kis.client import KISClient
+
+
+@pytest.fixture
+def live_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> KISClient:
+    monkeypatch.setenv("TEST_KIS_APPKEY", "key")
+    monkeypatch.setenv("TEST_KIS_APPSECRET", "secret")
+    config = {
+        "kis": {
+            "mode": "live",
+            "appkey_env": "TEST_KIS_APPKEY",
+            "appsecret_env": "TEST_KIS_APPSECRET",
+            "token_cache": str(tmp_path / "kis_token.json"),
+        }
+    }
+    return KISClient(config)
+
+
+def test_get_token_reads_disk_cache_once(live_client: KISClient) -> None:
+    expiry = datetime.utcnow() + timedelta(hours=1)
+    live_client.token_cache.write_text(
+        json.dumps({"access_token": "cached", "expires_at": expiry.isoformat()}),
+        encoding="utf-8",
+    )
+
+    first = live_client.get_token()
+    # 디스크 캐시를 지워도 메모리에 올라온 토큰을 그대로 재사용해야 한다.
+    live_client.token_cache.unlink()
+    second = live_client.get_token()
+
+    assert first["access_token"] == "cached"
+    assert second is first
+
+
+def test_get_token_refreshes_expired_token(live_client: KISClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    expired = datetime.utcnow() - timedelta(minutes=1)
+    live_client.token_cache.write_text(
+        json.dumps({"access_token": "stale", "expires_at": expired.isoformat()}),
+        encoding="utf-8",
+    )
+    issued = {"access_token": "fresh", "expires_at": (datetime.utcnow() + timedelta(hours=1)).isoformat()}
+    calls: list[int] = []
+
+    def fake_request() -> dict[str, str]:
+        calls.append(1)
+        return dict(issued)
+
+    monkeypatch.setattr(live_client, "_request_token", fake_request)
+
+    assert live_client.get_token()["access_token"] == "fresh"
+    assert live_client.get_token()["access_token"] == "fresh"
+    assert len(calls) == 1
+    assert json.loads(live_client.token_cache.read_text(encoding="utf-8"))["access_token"] == "fresh"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    ['{"access_token": "cached", "expires', '["not", "a", "dict"]', '{"access_token": "cached", "expires_at": "soon"}'],
+)
+def test_get_token_requests_new_token_when_cache_is_corrupt(
+    live_client: KISClient, monkeypatch: pytest.MonkeyPatch, payload: str
+) -> None:
+    live_client.token_cache.write_text(payload, encoding="utf-8")
+    issued = {"access_token": "fresh", "expires_at": (datetime.utcnow() + timedelta(hours=1)).isoformat()}
+    monkeypatch.setattr(live_client, "_request_token", lambda: dict(issued))
+
+    assert live_client.get_token()["access_token"] == "fresh"
+
+
+def test_get_series_batch_keeps_spec_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = KISClient({"kis": {"mode": "simulation", "max_workers": 4}})
+    seen: list[tuple[str, object]] = []
+
+    def fake_index(name: str, periods: int = 120) -> pd.DataFrame:
+        seen.append(("indexes", name))
+        return pd.DataFrame({"value": [1.0]})
+
+    def fake_futures(name: str, periods: int = 120, alias: object = None) -> pd.DataFrame:
+        seen.append(("futures", alias))
+        return pd.DataFrame({"value": [2.0]})
+
+    monkeypatch.setattr(client, "get_index_series", fake_index)
+    monkeypatch.setattr(client, "get_futures_series", fake_futures)
+
+    frames = client.get_series_batch([("indexes", "KOSPI", None), ("futures", "ES=F", "ES"), ("indexes", "SOX", None)])
+
+    # 동시에 조회하더라도 결과 키는 요청 순서를 따라야 한다.
+    assert list(frames) == ["KOSPI", "ES", "SOX"]
+    assert frames["ES"]["value"].iloc[0] == 2.0
+    assert sorted(seen, key=str) == sorted([("indexes", "KOSPI"), ("futures", "ES"), ("indexes", "SOX")], key=str)
+
+
+def test_rest_reuses_response_within_cache_ttl(
+    live_client: KISClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(live_client, "_auth_headers", lambda tr_id: {"tr_id": tr_id})
+    calls: list[dict[str, object]] = []
+
+    class FakeResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        @property
+        def content(self) -> bytes:
+            return json.dumps({"rt_cd": "0", "output": [len(calls)]}).encode("utf-8")
+
+    def fake_request(method: str, url: str, **kwargs: object) -> FakeResponse:
+        calls.append(kwargs)
+        return FakeResponse()
+
+    monkeypatch.setattr(live_client.session, "request", fake_request)
+
+    first = live_client._rest("GET", "/quote", params={"a": "1"}, tr_id="T", cache_ttl=60)
+    second = live_client._rest("GET", "/quote", params={"a": "1"}, tr_id="T", cache_ttl=60)
+    other = live_client._rest("GET", "/quote", params={"a": "2"}, tr_id="T", cache_ttl=60)
+    uncached = live_client._rest("GET", "/quote", params={"a": "1"}, tr_id="T")
+
+    assert second is first
+    assert other is not first
+    assert uncached is not first
+    assert len(calls) == 3
+
+
+def test_rest_cache_is_bounded_and_drops_expired_entries(
+    live_client: KISClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    live_client._resp_cache_size = 2
+    monkeypatch.setattr(live_client, "_auth_headers", lambda tr_id: {"tr_id": tr_id})
+
+    class FakeResponse:
+        content = json.dumps({"rt_cd": "0"}).encode("utf-8")
+
+        def raise_for_status(self) -> None:
+            return None
+
+    monkeypatch.setattr(live_client.session, "request", lambda method, url, **kwargs: FakeResponse())
+    clock = [100.0]
+    monkeypatch.setattr(client_module, "monotonic", lambda: clock[0])
+
+    live_client._rest("GET", "/a", tr_id="T", cache_ttl=60)
+    live_client._rest("GET", "/b", tr_id="T", cache_ttl=5)
+    live_client._rest("GET", "/a", tr_id="T", cache_ttl=60)
+    live_client._rest("GET", "/c", tr_id="T", cache_ttl=60)
+    # 크기 한도를 넘으면 가장 오래 안 쓴 /b가 빠진다.
+    assert [key[1] for key in live_client._resp_cache] == ["/a", "/c"]
+
+    clock[0] += 30
+    live_client._rest("GET", "/d", tr_id="T", cache_ttl=10)
+    clock[0] += 40
+    live_client._rest("GET", "/e", tr_id="T", cache_ttl=60)
+    # 넣을 때 만료된 항목(/c, /d)은 모두 지워진다.
+    assert [key[1] for key in live_client._resp_cache] == ["/e"]
+
+
+def test_pykrx_kor_yields_skips_weekends_and_reuses_past_dates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def fake_yields(date_str: str) -> pd.DataFrame:
+        calls.append(date_str)
+        return pd.DataFrame({"국고채(3년)": [3.1], "국고채(10년)": [3.4]})
+
+    monkeypatch.setattr(client_module.bond, "get_otc_treasury_yields", fake_yields)
+    client = KISClient({"kis": {"pykrx_yield_cache": str(tmp_path / "pykrx_yields.json")}})
+
+    first = client._pykrx_kor_yields(10)
+    assert len(first) == 10
+    assert all(datetime.strptime(day, "%Y%m%d").weekday() < 5 for day in calls)
+
+    today = datetime.now(client_module.KST).strftime("%Y%m%d")
+    calls.clear()
+    second = client._pykrx_kor_yields(10)
+    # 지난 날짜는 디스크 캐시에서 읽으므로 다시 조회하는 날짜는 오늘뿐이어야 한다.
+    assert set(calls) <= {today}
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_pykrx_kor_yields_retries_empty_responses(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_path = tmp_path / "pykrx_yields.json"
+    # 오래된 날짜와 예전 형식의 null 항목은 다음 저장 때 지워져야 한다.
+    cache_path.write_text(json.dumps({"19990104": [1.0, 2.0], "20000103": None}), encoding="utf-8")
+    monkeypatch.setattr(client_module.bond, "get_otc_treasury_yields", lambda date_str: pd.DataFrame())
+    client = KISClient({"kis": {"pykrx_yield_cache": str(cache_path)}})
+
+    assert client._pykrx_kor_yields(5).empty
+    assert json.loads(cache_path.read_text(encoding="utf-8")) == {}
+
+    calls: list[str] = []
+
+    def fake_yields(date_str: str) -> pd.DataFrame:
+        calls.append(date_str)
+        return pd.DataFrame({"국고채(3년)": [3.1], "국고채(10년)": [3.4]})
+
+    monkeypatch.setattr(client_module.bond, "get_otc_treasury_yields", fake_yields)
+
+    # 빈 응답은 캐시에 남지 않았으므로 다시 조회해 값을 채워야 한다.
+    assert len(client._pykrx_kor_yields(5)) == 5
+    assert calls
+
+
+def test_yf_history_downloads_each_symbol_once_per_day(monkeypatch: pytest.MonkeyPatch) -> None:
+    downloads: list[str] = []
+
+    def fake_download(symbol: str, **kwargs: object) -> pd.DataFrame:
+        downloads.append(symbol)
+        index = pd.date_range("2024-01-01", periods=5, freq="D")
+        return pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=index)
+
+    monkeypatch.setattr(client_module.yf, "download", fake_download)
+    client = KISClient({})
+
+    first = client._yf_history("^KS11", 3)
+    second = client._yf_history("^KS11", 5)
+
+    assert downloads == ["^KS11"]
+    assert first["value"].tolist() == [3.0, 4.0, 5.0]
+    assert len(second) == 5
+    assert isinstance(first["source"].dtype, pd.CategoricalDtype)
+    assert first["source"].tolist() == ["YahooFinance(^KS11)"] * 3
+
+
+def test_fetch_yield_with_retry_only_requests_days_since_cache(
+    live_client: KISClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    live_client.yield_cache_dir = tmp_path / "yields"
+    today = pd.Timestamp(datetime.now(client_module.KST).date()).tz_localize(client_module.KST)
+    requested: list[int] = []
+
+    def fake_fetch(group: str, name: str, periods: int = 120) -> pd.DataFrame:
+        requested.append(periods)
+        days = pd.DatetimeIndex([today - pd.Timedelta(days=offset) for offset in range(periods - 1, -1, -1)])
+        return pd.DataFrame({"ts_kst": days, "value": [float(len(requested))] * periods, "source": "KIS"})
+
+    monkeypatch.setattr(live_client, "_fetch_series", fake_fetch)
+
+    first = live_client._fetch_yield_with_retry("KR3Y", 10)
+    second = live_client._fetch_yield_with_retry("KR3Y", 10)
+
+    # 두 번째 호출은 어제까지 캐시를 쓰고 어제·오늘 치만 다시 받아야 한다.
+    assert requested == [10, 2]
+    assert len(first) == len(second) == 10
+    assert second["ts_kst"].tolist() == first["ts_kst"].tolist()
+    assert second["value"].tolist() == [1.0] * 8 + [2.0] * 2
+
+
+def test_ecos_kor_yields_fetches_each_series(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config = {
+        "kis": {"mode": "simulation", "yield_cache_dir": str(tmp_path / "yields")},
+        "ecos": {
+            "api_key": "KEY",
+            "series": {
+                "KR3Y": {"statistic": "060Y001", "items": ["0101000"]},
+                "KR10Y": {"statistic": "060Y001", "items": ["0103000"]},
+                "KR30Y": {"items": ["0106000"]},
+            },
+        },
+    }
+    client = KISClient(config)
+    urls: list[str] = []
+
+    class FakeResponse:
+        def __init__(self, item: str) -> None:
+            value = "3.1" if item == "0101000" else "3.4"
+            rows = [{"TIME": "20240102", "DATA_VALUE": value}, {"TIME": "20240103", "DATA_VALUE": value}]
+            self.content = json.dumps({"StatisticSearch": {"row": rows}}).encode("utf-8")
+
+        def raise_for_status(self) -> None:
+            return None
+
+    def fake_get(url: str, timeout: float) -> FakeResponse:
+        urls.append(url)
+        return FakeResponse(url.rstrip("/").rsplit("/", 1)[-1])
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    results, failures = client._ecos_kor_yields(["KR3Y", "KR10Y", "KR30Y"], periods=5)
+
+    assert len(urls) == 2 and all("/StatisticSearch/KEY/json/kr/" in url for url in urls)
+    assert results["KR3Y"]["value"].tolist() == [3.1, 3.1]
+    assert results["KR10Y"]["value"].tolist() == [3.4, 3.4]
+    assert failures == {"KR30Y": "ecos_statistic_missing"}
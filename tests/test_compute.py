@@ -1,5 +1,8 @@
 import math
 from statistics import pstdev
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from src import compute
@@ -14,6 +17,14 @@ def test_compute_hv_matches_manual():
     assert hv == pytest.approx(expected)
 
 
+def test_compute_hv_skips_zero_previous_price():
+    prices = [0, 101, 102, 100, 99]
+    hv = compute.compute_hv(prices, window=3)
+    log_returns = [math.log(102 / 101), math.log(100 / 102), math.log(99 / 100)]
+    assert hv == pytest.approx(math.sqrt(252) * pstdev(log_returns))
+    assert math.isnan(compute.compute_hv(prices, window=4))
+
+
 def test_compute_correlation():
     a = [1, 2, 3, 4, 5, 6, 7, 8]
     b = [2, 1, 4, 3, 6, 5, 8, 7]
@@ -34,3 +45,28 @@ def test_compute_basis():
     spot = 100.0
     basis = compute.compute_basis(future, spot)
     assert basis == pytest.approx(0.05)
+
+
+def test_btc_corr20_aligns_prices_before_differencing():
+    days = pd.date_range("2024-01-01", periods=60, freq="D", tz="Asia/Seoul")
+    business = days[days.dayofweek < 5]
+    rng = np.random.default_rng(7)
+    nq_prices = 15000 * np.exp(np.cumsum(rng.normal(0, 0.01, len(business))))
+    btc_prices = pd.Series(np.nan, index=days)
+    btc_prices[business] = nq_prices * 4
+    # 주말 BTC 가격은 NQ와 무관하게 움직인다.
+    weekend = btc_prices.isna()
+    btc_prices[weekend] = rng.uniform(40000, 80000, int(weekend.sum()))
+
+    def frame(asset, index, values):
+        return pd.DataFrame(
+            {"ts_kst": index, "asset": asset, "field": "close", "value": values, "source": "test", "quality": "primary", "url": ""}
+        )
+
+    raw = {
+        "BTC": frame("BTC", days, btc_prices.to_numpy()),
+        "NQ": frame("NQ", business, nq_prices),
+    }
+    records = compute.compute_records(pd.Timestamp("2024-03-01", tz="Asia/Seoul"), raw, {})
+    corr = next(row for row in records if row["asset"] == "BTC" and row["key"] == "corr20")
+    assert corr["value"] == pytest.approx(1.0)
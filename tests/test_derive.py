@@ -94,6 +94,48 @@ def test_compute_records_outputs_required_keys():
     assert required.issubset(seen)
 
 
+def test_compute_records_splits_mixed_field_frames():
+    ts = pd.Timestamp("2024-05-01", tz="Asia/Seoul")
+    close = make_series("KOSPI", "close", np.linspace(2500, 2539, 40))
+    close.loc[39, "source"] = "KRX-final"
+    advance = make_series("KOSPI", "advance", np.array([400.0, 420.0]), unit="issues")
+    frame = pd.concat([close, advance], ignore_index=True).sample(frac=1, random_state=3)
+
+    records = compute_records(ts, {"KOSPI": frame}, {})
+    by_key = {(row["asset"], row["key"]): row for row in records}
+    assert by_key[("KOSPI", "idx")]["value"] == pytest.approx(2539)
+    assert by_key[("KOSPI", "idx")]["source"] == "KRX-final"
+    assert by_key[("KOSPI", "advance")]["value"] == pytest.approx(420)
+
+
+def test_compute_records_handles_mixed_timezone_fields():
+    ts = pd.Timestamp("2024-05-01", tz="Asia/Seoul")
+    close = make_series("KOSPI", "close", np.linspace(2500, 2539, 40))
+    close["ts_kst"] = close["ts_kst"].dt.tz_localize("Asia/Seoul")
+    advance = make_series("KOSPI", "advance", np.array([400.0, 420.0]), unit="issues")
+    frame = pd.concat([close, advance], ignore_index=True)
+
+    records = compute_records(ts, {"KOSPI": frame}, {})
+    by_key = {(row["asset"], row["key"]): row for row in records}
+    assert by_key[("KOSPI", "idx")]["value"] == pytest.approx(2539)
+    assert by_key[("KOSPI", "advance")]["value"] == pytest.approx(420)
+
+
+def test_spread_combines_leg_sources():
+    ts = pd.Timestamp("2024-05-01", tz="Asia/Seoul")
+    long_leg = make_series("UST10Y", "yield", np.array([4.2, 4.3]), unit="pct")
+    short_leg = make_series("UST2Y", "yield", np.array([4.5, 4.6]), unit="pct")
+    long_leg["source"] = "treasury"
+    short_leg["source"] = "fred"
+    short_leg["url"] = ""
+
+    records = compute_records(ts, {"UST10Y": long_leg, "UST2Y": short_leg}, {})
+    spread = next(row for row in records if row["asset"] == "2s10s_US")
+    assert spread["source"] == "fred+treasury"
+    assert spread["url"] == ""
+    assert spread["value"] == pytest.approx(-30.0)
+
+
 def test_commod_crypto_fallback(monkeypatch):
     def boom(*_, **__):
         raise RuntimeError("network down")
@@ -6,6 +6,7 @@ from pathlib import Path
 import pandas as pd
 
 import update_history
+from src import storage
 
 
 KST = timezone(timedelta(hours=9))
@@ -313,3 +314,56 @@ def test_upsert_writes_empty_row_when_latest_missing(tmp_path: Path) -> None:
     assert report.field_status["kospi"]["status"] == "missing_latest"
     assert report.field_status["kospi"]["reason"] == "empty_latest_frame"
 
+
+def test_upsert_parses_mixed_timestamp_formats(tmp_path: Path) -> None:
+    latest_path = tmp_path / "out" / "latest.csv"
+    history_path = tmp_path / "out" / "history.csv"
+    write_latest(
+        latest_path,
+        [
+            {
+                "ts_kst": "2024-02-08 07:45",
+                "asset": "KOSPI",
+                "key": "idx",
+                "value": 2510,
+                "unit": "idx",
+                "window": "",
+                "source": "krx",
+                "quality": "final",
+                "notes": "",
+            },
+            {
+                "ts_kst": "2024-02-08 15:30:00",
+                "asset": "USD/KRW",
+                "key": "spot",
+                "value": 1331.0,
+                "unit": "KRW",
+                "window": "",
+                "source": "bok",
+                "quality": "secondary",
+                "notes": "",
+            },
+        ],
+    )
+
+    now = datetime(2024, 2, 8, 17, 1, tzinfo=KST)
+    update_history.upsert_from_latest(latest_path, history_path, now=now)
+
+    frame = pd.read_csv(history_path, dtype=str).fillna("")
+    record = frame.iloc[0]
+    assert float(record["kospi"]) == 2510
+    assert float(record["usdkrw"]) == 1331.0
+
+
+def test_run_snapshot_is_keyed_by_variant_and_ignores_corrupt_payload(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(storage, "RUN_CACHE_DIR", tmp_path / "last_run")
+    now = datetime(2024, 2, 2, 8, 0, tzinfo=KST)
+    rows = [{"asset": "KOSPI", "key": "idx", "value": 2500.0}]
+    storage.write_run_snapshot("0800", now, rows)
+
+    assert storage.load_run_snapshot("0800", now, timedelta(minutes=30)) == rows
+    # --reconcile 실행은 일반 실행의 스냅샷을 재사용하지 않는다.
+    assert storage.load_run_snapshot("0800", now, timedelta(minutes=30), "reconcile") is None
+
+    (tmp_path / "last_run" / "0800.json").write_text("[1, 2, 3]", encoding="utf-8")
+    assert storage.load_run_snapshot("0800", now, timedelta(minutes=30)) is None
@@ -1,5 +1,7 @@
 import datetime as dt
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from src import compute, utils
@@ -55,6 +57,33 @@ def test_record_builder_enforces_quality():
         })
 
 
+def test_record_builder_rejects_invalid_quality():
+    builder = compute.RecordBuilder("2024-01-02 07:30")
+    record = builder.make("TEST", "value", 1.0, quality="final")
+    assert list(record.to_dict()) == utils.SCHEMA_COLUMNS
+    assert record["change_abs"] is None
+
+    with pytest.raises(ValueError):
+        builder.make("TEST", "value", 1.0, quality="invalid")
+
+
+def test_ensure_schema_batch_checks_each_distinct_row_shape():
+    builder = compute.RecordBuilder("2024-01-02 07:30")
+    rows = [builder.make("TEST", f"k{i}", float(i)).to_dict() for i in range(3)]
+    assert utils.ensure_schema_batch(rows) == rows
+
+    with pytest.raises(ValueError, match="missing columns"):
+        utils.ensure_schema_batch(rows + [{"asset": "TEST", "quality": "primary"}])
+    with pytest.raises(ValueError, match="invalid quality"):
+        utils.ensure_schema_batch(rows + [dict(rows[0], quality="bogus")])
+
+
+def test_clip_numeric_array_matches_clip_numeric():
+    values = [None, float("nan"), float("inf"), 1.23456749, 0.0078125, 2.5e-7, 123.4565, 1.5e12 + 0.3, -4.9999995]
+    assert utils.clip_numeric_array(values) == [utils.clip_numeric(value) for value in values]
+    assert utils.clip_numeric_array(values)[:3] == [None, None, None]
+
+
 def test_coverage_ratio():
     required = {("A", "x"), ("B", "y")}
     rows = [
@@ -63,3 +92,22 @@ def test_coverage_ratio():
     ]
     coverage = utils.coverage_ratio(rows, required)
     assert coverage == pytest.approx(0.5)
+
+
+def test_compute_records_rejects_invalid_quality():
+    idx = pd.date_range("2024-01-01", periods=3, freq="B")
+    raw = {
+        "KOSPI": pd.DataFrame(
+            {
+                "ts_kst": idx,
+                "field": "close",
+                "value": np.array([2500.0, 2510.0, 2520.0]),
+                "unit": "pt",
+                "source": "unit",
+                "quality": "bogus",
+                "url": "",
+            }
+        )
+    }
+    with pytest.raises(ValueError, match="invalid quality"):
+        compute.compute_records(dt.datetime(2024, 1, 3, 7, 30), raw)
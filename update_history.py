@@ -154,7 +154,9 @@ def _load_latest(latest_path: Path, debug: DebugReport) -> pd.DataFrame:
             frame[required] = ""
 
     # 날짜 비교를 위해 KST 기준 날짜 컬럼을 추가합니다.
-    frame["ts_kst"] = pd.to_datetime(frame["ts_kst"], errors="coerce")
+    # format="ISO8601"은 "YYYY-MM-DD HH:MM"과 "YYYY-MM-DD HH:MM:SS"를 모두 C 파서로
+    # 한 번에 처리합니다. 형식을 추론하게 두면 첫 행과 모양이 다른 행이 NaT가 됩니다.
+    frame["ts_kst"] = pd.to_datetime(frame["ts_kst"], format="ISO8601", errors="coerce", cache=True)
     frame["window"] = frame["window"].fillna("")
     frame["date_kst"] = frame["ts_kst"].dt.date
     return frame